@@ -24,22 +24,32 @@
 
 Constants
 ---------
-LIMITS_DEFAULT = {
-    | "vi": [0.0, 1.0e6], # input voltage (V)
-    | "vo": [0.0, 1.0e6], # output voltage (V)
-    | "ii": [0.0, 1.0e6], # input current (A)
-    | "io": [0.0, 1.0e6], # output current (A)
-    | "pi": [0.0, 1.0e6], # input power (W)
-    | "po": [0.0, 1.0e6], # output power (W)
-    | "pl": [0.0, 1.0e6], # power loss (W)
-    | "tr": [0.0, 1.0e6]} # temperature rise (°C)
+LIMITS_DEFAULT = {  (read-only)
+    | "vi": (0.0, 1.0e6), # input voltage (V)
+    | "vo": (0.0, 1.0e6), # output voltage (V)
+    | "ii": (0.0, 1.0e6), # input current (A)
+    | "io": (0.0, 1.0e6), # output current (A)
+    | "pi": (0.0, 1.0e6), # input power (W)
+    | "po": (0.0, 1.0e6), # output power (W)
+    | "pl": (0.0, 1.0e6), # power loss (W)
+    | "tr": (0.0, 1.0e6)} # temperature rise (°C)
 
 """
 
+from abc import ABC, abstractmethod
 from enum import Enum, unique
-import toml
+from bisect import bisect_right
+from itertools import chain
+import copy
+import os
+import weakref
+from types import MappingProxyType
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
 import numpy as np
-from scipy.interpolate import LinearNDInterpolator
 
 __all__ = ["Source", "ILoad", "PLoad", "RLoad", "RLoss", "VLoss", "Converter", "LinReg"]
 
@@ -55,6 +65,12 @@ class _ComponentTypes(Enum):
     LINREG = 5
 
 
+_CHILD_TYPES_NOSOURCE = tuple(
+    t for t in _ComponentTypes if t is not _ComponentTypes.SOURCE
+)
+_CHILD_TYPES_NONE = (None,)
+
+
 MAX_DEFAULT = 1.0e6
 IQ_DEFAULT = 0.0
 IIS_DEFAULT = 0.0
@@ -62,41 +78,97 @@ RS_DEFAULT = 0.0
 RT_DEFAULT = 0.0
 VDROP_DEFAULT = 0.0
 PWRS_DEFAULT = 0.0
-LIMITS_DEFAULT = {
-    "vi": [0.0, MAX_DEFAULT],  # input voltage (V)
-    "vo": [0.0, MAX_DEFAULT],  # output voltage (V)
-    "ii": [0.0, MAX_DEFAULT],  # input current (A)
-    "io": [0.0, MAX_DEFAULT],  # output current (A)
-    "pi": [0.0, MAX_DEFAULT],  # input power (W)
-    "po": [0.0, MAX_DEFAULT],  # output power (W)
-    "pl": [0.0, MAX_DEFAULT],  # power loss (W)
-    "tr": [0.0, MAX_DEFAULT],  # temperature rise (°C)
-}
+INTERP_GROUP_MIN = 20  # min # of 1D interpolators evaluated as one group
+LIMITS_DEFAULT = MappingProxyType(
+    {
+        "vi": (0.0, MAX_DEFAULT),  # input voltage (V)
+        "vo": (0.0, MAX_DEFAULT),  # output voltage (V)
+        "ii": (0.0, MAX_DEFAULT),  # input current (A)
+        "io": (0.0, MAX_DEFAULT),  # output current (A)
+        "pi": (0.0, MAX_DEFAULT),  # input power (W)
+        "po": (0.0, MAX_DEFAULT),  # output power (W)
+        "pl": (0.0, MAX_DEFAULT),  # power loss (W)
+        "tr": (0.0, MAX_DEFAULT),  # temperature rise (°C)
+    }
+)
+_TOML_CACHE = {}  # tomllib is pure Python, a deepcopy of the parsed dict is ~4x faster
+_INTERP_CACHE = weakref.WeakValueDictionary()  # released with the last component
+
+
+def _load_toml(fname):
+    """Load .toml file, cached by path and parsed again if mtime or size changes"""
+    st = os.stat(fname)
+    path = os.path.realpath(fname)
+    stamp = (st.st_mtime_ns, st.st_size)
+    if path not in _TOML_CACHE or _TOML_CACHE[path][0] != stamp:
+        with open(fname, "rb") as f:
+            _TOML_CACHE[path] = (stamp, tomllib.load(f))
+    return copy.deepcopy(_TOML_CACHE[path][1])
 
 
 def _get_opt(params, key, default):
     """Get optional parameter from dict"""
-    if key in params:
-        return params[key]
-    return default
+    return params.get(key, default)
 
 
 def _get_mand(params, key):
     """Get mandatory parameter from dict"""
-    if key in params:
+    try:
         return params[key]
-    raise KeyError("Parameter dict is missing entry for '{}'".format(key))
+    except KeyError:
+        raise KeyError("Parameter dict is missing entry for '{}'".format(key)) from None
+
+
+def _get_limits(limits):
+    """Get a copy of limits, LIMITS_DEFAULT is used if limits is None"""
+    if limits is None:
+        limits = LIMITS_DEFAULT
+    return {key: list(lim) for key, lim in limits.items()}
+
+
+def _get_lims(limits):
+    """Get absolute (lower, upper) limits for all limit keys"""
+    lims = {}
+    for key in LIMITS_DEFAULT:
+        lim = limits.get(key, LIMITS_DEFAULT[key])
+        lims[key] = (abs(lim[0]), abs(lim[1]))
+    return lims
+
+
+def _get_warns(lims, checks):
+    """Check parameter values against limits from _get_lims()"""
+    warn = []
+    for key, val in checks.items():
+        lo, hi = lims[key]
+        if abs(val) > hi or abs(val) < lo:
+            warn += [key]
+    return " ".join(warn)
+
+
+def _vec_lims(comps):
+    """Get (lower, upper) limit arrays of components for all limit keys"""
+    n = len(LIMITS_DEFAULT)
+    vals = chain.from_iterable(chain.from_iterable(c._lims.values() for c in comps))
+    lims = np.fromiter(vals, dtype=float, count=2 * n * len(comps))
+    lims = lims.reshape(len(comps), n, 2)
+    return {key: lims[:, k].T for k, key in enumerate(LIMITS_DEFAULT)}
 
 
-def _get_warns(limits, checks):
-    """Check parameter values against limits"""
-    warn = ""
+def _vec_warns(lims, checks, off=None):
+    """Check arrays of parameter values against limits from _vec_lims()"""
     keys = list(checks.keys())
-    for key in keys:
-        lim = _get_opt(limits, key, [0, MAX_DEFAULT])
-        if abs(checks[key]) > abs(lim[1]) or abs(checks[key]) < abs(lim[0]):
-            warn += key + " "
-    return warn.strip()
+    bad = np.array(
+        [
+            (np.abs(checks[key]) > lims[key][1]) | (np.abs(checks[key]) < lims[key][0])
+            for key in keys
+        ]
+    )
+    if off is not None:
+        bad &= ~off
+    warns = [""] * bad.shape[1]
+    for n in np.flatnonzero(bad.any(axis=0)):
+        warns[n] = " ".join(key for key, b in zip(keys, bad[:, n]) if b)
+    return warns
 
 
 def _get_eff(ipwr, opwr, def_eff=100.0):
@@ -106,6 +178,92 @@ def _get_eff(ipwr, opwr, def_eff=100.0):
     return def_eff
 
 
+def _vec_eff(ipwr, opwr, def_eff=100.0):
+    """Calculate efficiencies in % for arrays of power"""
+    pos = ipwr > 0.0
+    eff = np.divide(opwr, ipwr, out=np.zeros(np.shape(ipwr)), where=pos)
+    return np.where(pos, 100.0 * np.abs(eff), def_eff)
+
+
+def _is_off(phase, phase_conf):
+    """Check if component is off (not active) in phase"""
+    if not phase_conf:
+        return False
+    return phase not in phase_conf
+
+
+def _vec_ipr(comps):
+    """Get interpolators of components for batched evaluation.
+
+    If all interpolators are constant, an array of the constants is returned.
+    If there are many components sharing one interpolator, it is returned.
+    If there are many 1D interpolators, they are combined into one _Interp1dGroup."""
+    iprs = [c._ipr for c in comps]
+    if all(isinstance(ipr, _Interp0d) for ipr in iprs):
+        return np.array([ipr._x for ipr in iprs], dtype=float)
+    if len(iprs) >= INTERP_GROUP_MIN and all(ipr is iprs[0] for ipr in iprs):
+        return iprs[0]
+    if len(iprs) >= INTERP_GROUP_MIN and all(
+        isinstance(ipr, _Interp1d) for ipr in iprs
+    ):
+        return _Interp1dGroup(iprs)
+    return iprs
+
+
+def _vec_interp(iprs, x, y):
+    """Evaluate interpolators element-wise"""
+    if isinstance(iprs, np.ndarray):
+        return iprs
+    if not isinstance(iprs, list):
+        return iprs._interp_vec(x, y)
+    return np.array([ipr._interp(xk, yk) for ipr, xk, yk in zip(iprs, x, y)])
+
+
+def _vec_unstable(prm, s, vo, ctype):
+    """Raise exception if output voltage of series loss has changed sign (s = sign(vi))"""
+    bad = np.flatnonzero((s != 0.0) & (vo * s <= 0.0))
+    if len(bad) > 0:
+        raise ValueError(
+            "Unstable system: {} component '{}' has zero output voltage".format(
+                ctype, prm["name"][bad[0]]
+            )
+        )
+
+
+def _sweep_params(comp, n, phase, phase_conf):
+    """Get parameter arrays for evaluating one component at n operating points"""
+    prm = comp._vec_params([comp], phase, [phase_conf])
+    for key, val in prm.items():
+        if isinstance(val, np.ndarray):
+            prm[key] = np.broadcast_to(val, n)
+        elif key == "ipr":
+            prm[key] = val[0]
+        else:
+            prm[key] = val * n
+    return prm
+
+
+def _sweep_inp_curr(comp, vi, vo, io, phase="", phase_conf=()):
+    """Calculate component input current for arrays of vi, vo and io"""
+    vi, vo, io = np.broadcast_arrays(*np.atleast_1d(vi, vo, io))
+    prm = _sweep_params(comp, len(vi), phase, phase_conf)
+    return comp._vec_inp_curr(prm, vi, vo, io)
+
+
+def _sweep_outp_volt(comp, vi, ii, io, phase="", phase_conf=()):
+    """Calculate component output voltage for arrays of vi, ii and io"""
+    vi, ii, io = np.broadcast_arrays(*np.atleast_1d(vi, ii, io))
+    prm = _sweep_params(comp, len(vi), phase, phase_conf)
+    return comp._vec_outp_volt(prm, vi, ii, io)
+
+
+def _sweep_pwr_loss(comp, vi, vo, ii, io, phase="", phase_conf=()):
+    """Calculate power and loss for arrays of vi, vo, ii and io"""
+    vi, vo, ii, io = np.broadcast_arrays(*np.atleast_1d(vi, vo, ii, io))
+    prm = _sweep_params(comp, len(vi), phase, phase_conf)
+    return comp._vec_pwr_loss(prm, vi, vo, ii, io)
+
+
 class _Interp0d:
     """Dummy interpolator for constant"""
 
@@ -116,78 +274,178 @@ class _Interp0d:
         """Return constant"""
         return self._x
 
+    def _interp_vec(self, x, y):
+        """Return constant for arrays of x and y"""
+        return np.full(np.shape(x), self._x, dtype=float)
+
 
 class _Interp1d:
     """1D interpolator, x must be monotonic rising"""
 
     def __init__(self, x, fx):
-        self._x = np.abs(np.asarray(x))
-        self._fx = np.abs(np.asarray(fx))
+        self._x = np.abs(np.asarray(x, dtype=float))
+        self._fx = np.abs(np.asarray(fx, dtype=float))
+        self._xl = self._x.tolist()
+        self._fxl = self._fx.tolist()
+        self._slopes = (np.diff(self._fx) / np.diff(self._x)).tolist()
 
     def _interp(self, x: float, y: float) -> float:
-        """1D interpolation"""
+        """1D interpolation, constant outside of x range"""
+        ax = abs(x)
+        if ax <= self._xl[0]:
+            return self._fxl[0]
+        if ax >= self._xl[-1]:
+            return self._fxl[-1]
+        i = bisect_right(self._xl, ax) - 1
+        return self._fxl[i] + self._slopes[i] * (ax - self._xl[i])
+
+    def _interp_vec(self, x, y):
+        """1D interpolation of arrays, constant outside of x range"""
         return np.interp(np.abs(x), self._x, self._fx)
 
 
+class _Interp1dGroup:
+    """Group of 1D interpolators, evaluated with one query point per interpolator"""
+
+    def __init__(self, iprs):
+        n = np.array([len(ipr._xl) for ipr in iprs])
+        first = np.cumsum(n) - n
+        self._x = np.concatenate([ipr._x for ipr in iprs])
+        self._fx = np.concatenate([ipr._fx for ipr in iprs])
+        self._slopes = np.concatenate([ipr._slopes + [0.0] for ipr in iprs])
+        self._lo = self._x[first]
+        self._hi = self._x[first + n - 1]
+        self._fhi = self._fx[first + n - 1]
+        self._first = first
+        self._last = first + np.maximum(n - 2, 0)
+        # shift each x range so that the concatenated x values are increasing
+        span = self._hi - self._lo + 1.0
+        self._off = np.cumsum(span) - span
+        self._xs = self._x - np.repeat(self._lo, n) + np.repeat(self._off, n)
+
+    def _interp_vec(self, x, y):
+        """1D interpolation of x[k] with interpolator k, constant outside of x range"""
+        ax = np.minimum(np.maximum(np.abs(x), self._lo), self._hi)
+        i = np.searchsorted(self._xs, ax - self._lo + self._off, side="right") - 1
+        i = np.minimum(np.maximum(i, self._first), self._last)
+        fx = self._fx[i] + self._slopes[i] * (ax - self._x[i])
+        return np.where(ax >= self._hi, self._fhi, fx)
+
+
 class _Interp2d:
-    """2D interpolator"""
+    """2D interpolator, x and y values must form a regular grid"""
 
     def __init__(self, x, y, fxy):
         self._x = np.abs(x)
         self._y = np.abs(y)
         self._fxy = np.abs(fxy)
-        self._xmin = min(self._x)
-        self._xmax = max(self._x)
-        self._ymin = min(self._y)
-        self._ymax = max(self._y)
-        self._intp = LinearNDInterpolator(list(zip(self._x, self._y)), self._fxy)
+        xg = np.unique(self._x)
+        yg = np.unique(self._y)
+        grid = np.full((len(xg), len(yg)), np.nan)
+        grid[np.searchsorted(xg, self._x), np.searchsorted(yg, self._y)] = self._fxy
+        self._set_grid(xg, yg, grid)
+
+    def _set_grid(self, xg, yg, grid):
+        """Set grid axes and values, grid[i][j] is the value at (xg[i], yg[j])"""
+        if len(xg) < 2 or len(yg) < 2:
+            raise ValueError("Interpolation data must have at least two x and y values")
+        if np.isnan(grid).any():
+            raise ValueError("Interpolation data must be a regular grid")
+        self._intp = None  # created on first array query
+        self._xg = xg.tolist()
+        self._yg = yg.tolist()
+        self._grid = grid.tolist()
+
+    def __getstate__(self):
+        """Pickle without the array interpolator, it is rebuilt on demand"""
+        state = self.__dict__.copy()
+        state["_intp"] = None
+        return state
+
+    @classmethod
+    def _from_grid(cls, x, y, fxy):
+        """Create interpolator from grid data, fxy has one row of x values per y value"""
+        xg = np.abs(np.asarray(x, dtype=float))
+        yg = np.abs(np.asarray(y, dtype=float))
+        fg = np.abs(np.asarray(fxy, dtype=float))
+        xx, yy = np.meshgrid(xg, yg)
+        if (
+            fg.shape != xx.shape
+            or np.any(np.diff(xg) <= 0.0)
+            or np.any(np.diff(yg) <= 0.0)
+        ):
+            return cls(xx.ravel(), yy.ravel(), fg.ravel())
+        ipr = cls.__new__(cls)
+        ipr._x = xx.ravel()
+        ipr._y = yy.ravel()
+        ipr._fxy = fg.ravel()
+        ipr._set_grid(xg, yg, fg.T)
+        return ipr
 
     def _interp(self, x: float, y: float) -> float:
-        """2D interpolation"""
-        fxy = self._intp([x], [y])[0]
-        if not np.isnan(fxy):
-            return fxy
-        if x < self._xmin:
-            if y < self._ymin:
-                return self._intp([self._xmin], [self._ymin])[0]
-            if y > self._ymax:
-                return self._intp([self._xmin], [self._ymax])[0]
-            return self._intp([self._xmin], [y])[0]
-        if x > self._xmax:
-            if y < self._ymin:
-                return self._intp([self._xmax], [self._ymin])[0]
-            if y > self._ymax:
-                return self._intp([self._xmax], [self._ymax])[0]
-            return self._intp([self._xmax], [y])[0]
-        if y < self._ymin:
-            return self._intp([x], [self._ymin])[0]
-        return self._intp([x], [self._ymax])[0]
-
-
-class _ComponentMeta(type):
-    """An component metaclass that will be used for component class creation."""
-
-    def __instancecheck__(cls, instance):
-        return cls.__subclasscheck__(type(instance))
-
-    def __subclasscheck__(cls, subclass):
-        return (
-            hasattr(subclass, "_component_type")
-            and hasattr(subclass, "_child_types")
-            and hasattr(subclass, "from_file")
-            and callable(subclass.from_file)
-        )
+        """2D (bilinear) interpolation, constant outside of grid"""
+        xg, yg = self._xg, self._yg
+        x = min(max(x, xg[0]), xg[-1])
+        y = min(max(y, yg[0]), yg[-1])
+        i = min(bisect_right(xg, x), len(xg) - 1) - 1
+        j = min(bisect_right(yg, y), len(yg) - 1) - 1
+        tx = (x - xg[i]) / (xg[i + 1] - xg[i])
+        ty = (y - yg[j]) / (yg[j + 1] - yg[j])
+        g0, g1 = self._grid[i], self._grid[i + 1]
+        f0 = g0[j] * (1.0 - tx) + g1[j] * tx
+        f1 = g0[j + 1] * (1.0 - tx) + g1[j + 1] * tx
+        return f0 * (1.0 - ty) + f1 * ty
+
+    def _interp_vec(self, x, y):
+        """2D (bilinear) interpolation of arrays, constant outside of grid"""
+        xg, yg = self._xg, self._yg
+        x = np.clip(x, xg[0], xg[-1])
+        y = np.clip(y, yg[0], yg[-1])
+        if self._intp is None:
+            from scipy.interpolate import RegularGridInterpolator
+
+            self._intp = RegularGridInterpolator(
+                (xg, yg), self._grid, method="linear", bounds_error=False
+            )
+        return self._intp(np.stack([x, y], axis=-1))
+
+
+def _make_interp(data, key):
+    """Create 1D or 2D interpolator from data dict with io, vi and key values"""
+    io = data["io"]
+    if not all(a < b for a, b in zip(io[:-1], io[1:])):
+        raise ValueError("io values must be monotonic increasing")
+    # components with identical tables share one interpolator
+    fxy = np.asarray(data[key], dtype=float)
+    ckey = (
+        np.asarray(io, dtype=float).tobytes(),
+        np.asarray(data["vi"], dtype=float).tobytes(),
+        fxy.shape,
+        fxy.tobytes(),
+    )
+    ipr = _INTERP_CACHE.get(ckey)
+    if ipr is None:
+        if len(data["vi"]) == 1:
+            ipr = _Interp1d(io, data[key][0])
+        else:
+            ipr = _Interp2d._from_grid(io, data["vi"], data[key])
+        _INTERP_CACHE[ckey] = ipr
+    return ipr
 
 
-class _ComponentInterface(metaclass=_ComponentMeta):
-    """This interface is used for concrete component classes to inherit from.
-    There is no need to define the ComponentMeta methods of any class
-    as they are implicitly made available via .__subclasscheck__().
+class _ComponentInterface(ABC):
+    """Interface of the concrete component classes.
+    Component classes are registered as virtual subclasses with the
+    @_ComponentInterface.register decorator.
     """
 
-    pass
+    @classmethod
+    @abstractmethod
+    def from_file(cls, name: str, *, fname: str):
+        """Read component parameters from .toml file"""
 
 
+@_ComponentInterface.register
 class Source:
     """The Source component must be the root of a system or subsystem.
 
@@ -204,17 +462,10 @@ class Source:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the Source component type"""
-        return _ComponentTypes.SOURCE
+    __slots__ = ("_params", "_limits", "_lims", "_ipr", "_vo", "_rs")
 
-    @property
-    def _child_types(self):
-        """Defines allowable Source child component types"""
-        et = list(_ComponentTypes)
-        et.remove(_ComponentTypes.SOURCE)
-        return et
+    _component_type = _ComponentTypes.SOURCE
+    _child_types = _CHILD_TYPES_NOSOURCE
 
     def __init__(
         self,
@@ -222,14 +473,17 @@ class Source:
         *,
         vo: float,
         rs: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
     ):
         self._params = {}
         self._params["name"] = name
         self._params["vo"] = vo
         self._params["rs"] = abs(rs)
         self._params["rt"] = 0.0
-        self._limits = limits
+        self._vo = vo
+        self._rs = abs(rs)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
         self._ipr = None
 
     @classmethod
@@ -243,47 +497,83 @@ class Source:
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         v = _get_mand(config["source"], "vo")
         r = _get_opt(config["source"], "rs", RS_DEFAULT)
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         return cls(name, vo=v, rs=r, limits=lim)
 
-    def _get_inp_current(self, phase, phase_conf={}):
+    def _get_inp_current(self, phase, phase_conf=()):
         return 0.0
 
-    def _get_outp_voltage(self, phase, phase_conf={}):
-        return self._params["vo"]
+    def _get_outp_voltage(self, phase, phase_conf=()):
+        return self._vo
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
-        if self._params["vo"] == 0.0:
+        if self._vo == 0.0:
             return 0.0
         return io
 
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf={}):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Calculate component output voltage from vi, ii and io"""
-        if self._params["vo"] == 0.0:
+        if self._vo == 0.0:
             return 0.0
-        return self._params["vo"] - self._params["rs"] * io
-
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf={}):
+        return self._vo - self._rs * io
+
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        return {
+            "vo": np.array([c._vo for c in comps], dtype=float),
+            "rs": np.array([c._rs for c in comps], dtype=float),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        return np.where(prm["vo"] == 0.0, 0.0, io)
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Calculate output voltages of batched components"""
+        return np.where(prm["vo"] == 0.0, 0.0, prm["vo"] - prm["rs"] * io)
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
-        if self._params["vo"] == 0.0:
+        if self._vo == 0.0:
             return 0.0, 0.0, 100.0, 0.0
-        ipwr = abs(self._params["vo"] * io)
-        loss = self._params["rs"] * io * io
+        ipwr = abs(self._vo * io)
+        loss = self._rs * io * io
         opwr = ipwr - loss
         return ipwr, loss, _get_eff(ipwr, opwr), 0.0
 
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        ipwr = np.abs(prm["vo"] * io)
+        loss = prm["rs"] * io * io
+        eff = _vec_eff(ipwr, ipwr - loss)
+        on = prm["vo"] != 0.0
+        return (
+            np.where(on, ipwr, 0.0),
+            np.where(on, loss, 0.0),
+            np.where(on, eff, 100.0),
+            np.zeros(len(vi)),
+        )
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
         return _get_warns(
-            self._limits, {"io": io, "po": vo * io, "pl": self._params["rs"] * io * io}
+            self._lims, {"io": io, "po": vo * io, "pl": self._rs * io * io}
         )
 
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        return _vec_warns(lims, {"io": io, "po": vo * io, "pl": prm["rs"] * io * io})
+
     def _get_params(self, pdict):
         """Return dict with component parameters"""
         ret = pdict
@@ -292,6 +582,7 @@ class Source:
         return ret
 
 
+@_ComponentInterface.register
 class PLoad:
     """Power load.
 
@@ -310,22 +601,17 @@ class PLoad:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the Load component type"""
-        return _ComponentTypes.LOAD
+    __slots__ = ("_params", "_limits", "_lims", "_ipr", "_pwr", "_pwrs", "_rt")
 
-    @property
-    def _child_types(self):
-        """The Load component cannot have childs"""
-        return [None]
+    _component_type = _ComponentTypes.LOAD
+    _child_types = _CHILD_TYPES_NONE
 
     def __init__(
         self,
         name: str,
         *,
         pwr: float,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
         pwrs: float = 0.0,
         rt: float = 0.0,
     ):
@@ -334,7 +620,11 @@ class PLoad:
         self._params["pwr"] = abs(pwr)
         self._params["pwrs"] = abs(pwrs)
         self._params["rt"] = abs(rt)
-        self._limits = limits
+        self._pwr = abs(pwr)
+        self._pwrs = abs(pwrs)
+        self._rt = abs(rt)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
         self._ipr = None
 
     @classmethod
@@ -348,51 +638,90 @@ class PLoad:
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         p = _get_mand(config["pload"], "pwr")
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         pwrs = _get_opt(config["pload"], "pwrs", PWRS_DEFAULT)
         rt = _get_opt(config["pload"], "rt", RT_DEFAULT)
         return cls(name, pwr=p, limits=lim, pwrs=pwrs, rt=rt)
 
-    def _get_inp_current(self, phase, phase_conf={}):
+    def _get_inp_current(self, phase, phase_conf=()):
         return 0.0
 
-    def _get_outp_voltage(self, phase, phase_conf={}):
+    def _get_outp_voltage(self, phase, phase_conf=()):
         return 0.0
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
+    def _phase_value(self, phase, phase_conf=()):
+        """Get load value (power) in phase"""
+        if not phase_conf:
+            return self._pwr
+        return phase_conf.get(phase, self._pwrs)
+
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
         if vi == 0.0:
             return 0.0
-        if not phase_conf:
-            p = self._params["pwr"]
-        elif phase not in phase_conf:
-            p = self._params["pwrs"]
-        else:
-            p = phase_conf[phase]
+        return self._phase_value(phase, phase_conf) / abs(vi)
 
-        return p / abs(vi)
-
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf={}):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Load output voltage is always 0"""
         return 0.0
 
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf={}):
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        p = [c._phase_value(phase, pc) for c, pc in zip(comps, phase_confs)]
+        return {
+            "p": np.array(p, dtype=float),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "off": np.array(
+                [phase != "" and _is_off(phase, pc) for pc in phase_confs], dtype=bool
+            ),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(vi == 0.0, 0.0, prm["p"] / np.abs(vi))
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Load output voltage is always 0"""
+        return np.zeros(len(vi))
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
         if vi == 0.0:
             return 0.0, 0.0, 100.0, 0.0
-        return abs(vi * ii), 0.0, 100.0, abs(vi * ii) * self._params["rt"]
+        pwr = abs(vi * ii)
+        return pwr, 0.0, 100.0, pwr * self._rt
 
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        pwr = np.abs(vi * ii)
+        on = vi != 0.0
+        return (
+            np.where(on, pwr, 0.0),
+            np.zeros(len(vi)),
+            np.full(len(vi), 100.0),
+            np.where(on, pwr * prm["rt"], 0.0),
+        )
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
-        if phase_conf and phase != "":
-            if phase not in phase_conf:
-                return ""
-        tr = vi * ii * self._params["rt"]
-        return _get_warns(self._limits, {"vi": vi, "ii": ii, "tr": tr})
+        if phase_conf and phase != "" and phase not in phase_conf:
+            return ""
+        tr = vi * ii * self._rt
+        return _get_warns(self._lims, {"vi": vi, "ii": ii, "tr": tr})
+
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        tr = vi * ii * prm["rt"]
+        return _vec_warns(lims, {"vi": vi, "ii": ii, "tr": tr}, prm["off"])
 
     def _get_params(self, pdict):
         """Return dict with component parameters"""
@@ -403,6 +732,7 @@ class PLoad:
         return ret
 
 
+@_ComponentInterface.register
 class ILoad(PLoad):
     """Current load.
 
@@ -421,21 +751,27 @@ class ILoad(PLoad):
 
     """
 
+    __slots__ = ("_ii", "_iis")
+
     def __init__(
         self,
         name: str,
         *,
         ii: float,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
         iis: float = 0.0,
         rt: float = 0.0,
     ):
         self._params = {}
         self._params["name"] = name
         self._params["ii"] = abs(ii)
-        self._limits = limits
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
         self._params["iis"] = abs(iis)
         self._params["rt"] = abs(rt)
+        self._ii = abs(ii)
+        self._iis = abs(iis)
+        self._rt = abs(rt)
         self._ipr = None
 
     @classmethod
@@ -449,37 +785,57 @@ class ILoad(PLoad):
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         i = _get_mand(config["iload"], "ii")
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         iis = _get_opt(config["iload"], "iis", IIS_DEFAULT)
         rt = _get_opt(config["iload"], "rt", RT_DEFAULT)
         return cls(name, ii=i, limits=lim, iis=iis, rt=rt)
 
-    def _get_inp_current(self, phase, phase_conf={}):
-        return self._params["ii"]
+    def _get_inp_current(self, phase, phase_conf=()):
+        return self._ii
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
+    def _phase_value(self, phase, phase_conf=()):
+        """Get load value (current) in phase"""
+        if not phase_conf:
+            return self._ii
+        return phase_conf.get(phase, self._iis)
+
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         if vi == 0.0:
             return 0.0
-        if not phase_conf:
-            i = self._params["ii"]
-        elif phase not in phase_conf:
-            i = self._params["iis"]
-        else:
-            i = phase_conf[phase]
+        return abs(self._phase_value(phase, phase_conf))
+
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        i = [c._phase_value(phase, pc) for c, pc in zip(comps, phase_confs)]
+        return {
+            "i": np.abs(np.array(i, dtype=float)),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "off": np.array(
+                [phase != "" and _is_off(phase, pc) for pc in phase_confs], dtype=bool
+            ),
+        }
 
-        return abs(i)
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        return np.where(vi == 0.0, 0.0, prm["i"])
 
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
-        if phase_conf and phase != "":
-            if phase not in phase_conf:
-                return ""
-        tr = vi * ii * self._params["rt"]
-        return _get_warns(self._limits, {"vi": vi, "pi": vi * ii, "tr": tr})
+        if phase_conf and phase != "" and phase not in phase_conf:
+            return ""
+        tr = vi * ii * self._rt
+        return _get_warns(self._lims, {"vi": vi, "pi": vi * ii, "tr": tr})
+
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        tr = vi * ii * prm["rt"]
+        return _vec_warns(lims, {"vi": vi, "pi": vi * ii, "tr": tr}, prm["off"])
 
     def _get_params(self, pdict):
         """Return dict with component parameters"""
@@ -490,6 +846,7 @@ class ILoad(PLoad):
         return ret
 
 
+@_ComponentInterface.register
 class RLoad(PLoad):
     """Resistive load.
 
@@ -506,13 +863,15 @@ class RLoad(PLoad):
 
     """
 
+    __slots__ = ("_rs",)
+
     def __init__(
         self,
         name: str,
         *,
         rs: float,
         rt: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
     ):
         self._params = {}
         self._params["name"] = name
@@ -520,7 +879,10 @@ class RLoad(PLoad):
             raise ValueError("rs must be > 0!")
         self._params["rs"] = abs(rs)
         self._params["rt"] = abs(rt)
-        self._limits = limits
+        self._rs = abs(rs)
+        self._rt = abs(rt)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
         self._ipr = None
 
     @classmethod
@@ -534,31 +896,53 @@ class RLoad(PLoad):
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         r = _get_mand(config["rload"], "rs")
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         rt = _get_opt(config["rload"], "rt", RT_DEFAULT)
         return cls(name, rs=r, rt=rt, limits=lim)
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
-        r = self._params["rs"]
+    def _phase_value(self, phase, phase_conf=()):
+        """Get load value (resistance) in phase"""
         if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            pass
-        else:
-            r = phase_conf[phase]
-        return abs(vi) / r
+            return self._rs
+        return phase_conf.get(phase, self._rs)
+
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
+        return abs(vi) / self._phase_value(phase, phase_conf)
+
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        r = [c._phase_value(phase, pc) for c, pc in zip(comps, phase_confs)]
+        return {
+            "rs": np.array(r, dtype=float),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "off": np.array(
+                [phase != "" and _is_off(phase, pc) for pc in phase_confs], dtype=bool
+            ),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        return np.abs(vi) / prm["rs"]
 
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
-        if phase_conf and phase != "":
-            if phase not in phase_conf:
-                return ""
-        tr = vi * ii * self._params["rt"]
-        return _get_warns(self._limits, {"vi": vi, "ii": ii, "pi": vi * ii, "tr": tr})
+        if phase_conf and phase != "" and phase not in phase_conf:
+            return ""
+        tr = vi * ii * self._rt
+        return _get_warns(self._lims, {"vi": vi, "ii": ii, "pi": vi * ii, "tr": tr})
+
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        tr = vi * ii * prm["rt"]
+        return _vec_warns(
+            lims, {"vi": vi, "ii": ii, "pi": vi * ii, "tr": tr}, prm["off"]
+        )
 
     def _get_params(self, pdict):
         """Return dict with component parameters"""
@@ -568,6 +952,7 @@ class RLoad(PLoad):
         return ret
 
 
+@_ComponentInterface.register
 class RLoss:
     """Resistive loss.
 
@@ -586,17 +971,10 @@ class RLoss:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the Loss component type"""
-        return _ComponentTypes.SLOSS
+    __slots__ = ("_params", "_limits", "_lims", "_ipr", "_rs", "_rt")
 
-    @property
-    def _child_types(self):
-        """Defines allowable Loss child component types"""
-        et = list(_ComponentTypes)
-        et.remove(_ComponentTypes.SOURCE)
-        return et
+    _component_type = _ComponentTypes.SLOSS
+    _child_types = _CHILD_TYPES_NOSOURCE
 
     def __init__(
         self,
@@ -604,13 +982,16 @@ class RLoss:
         *,
         rs: float,
         rt: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
     ):
         self._params = {}
         self._params["name"] = name
         self._params["rs"] = abs(rs)
         self._params["rt"] = abs(rt)
-        self._limits = limits
+        self._rs = abs(rs)
+        self._rt = abs(rt)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
         self._ipr = None
 
     @classmethod
@@ -624,32 +1005,31 @@ class RLoss:
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         r = _get_mand(config["rloss"], "rs")
         rt = _get_opt(config["rloss"], "rt", RT_DEFAULT)
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         return cls(name, rs=r, limits=lim, rt=rt)
 
-    def _get_inp_current(self, phase, phase_conf={}):
+    def _get_inp_current(self, phase, phase_conf=()):
         return 0.0
 
-    def _get_outp_voltage(self, phase, phase_conf={}):
+    def _get_outp_voltage(self, phase, phase_conf=()):
         return 0.0
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
-        if abs(vi) == 0.0:
+        if vi == 0.0:
             return 0.0
         return io
 
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf={}):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Calculate component output voltage from vi, ii and io"""
-        if abs(vi) == 0.0:
+        if vi == 0.0:
             return 0.0
-        vo = vi - self._params["rs"] * io * np.sign(vi)
-        if np.sign(vo) == np.sign(vi):
+        vo = vi - self._rs * io * (1.0 if vi > 0.0 else -1.0)
+        if vo * vi > 0.0:
             return vo
         raise ValueError(
             "Unstable system: RLoss component '{}' has zero output voltage".format(
@@ -657,21 +1037,56 @@ class RLoss:
             )
         )
 
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf={}):
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        return {
+            "name": [c._params["name"] for c in comps],
+            "rs": np.array([c._rs for c in comps], dtype=float),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        return np.where(vi == 0.0, 0.0, io)
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Calculate output voltages of batched components"""
+        s = np.sign(vi)
+        vo = vi - prm["rs"] * io * s
+        _vec_unstable(prm, s, vo, "RLoss")
+        return np.where(vi == 0.0, 0.0, vo)
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
-        vout = vi - self._params["rs"] * io * np.sign(vi)
-        if np.sign(vout) != np.sign(vi):
+        if vi == 0.0:
+            return 0.0, 0.0, 100.0, 0.0
+        vout = vi - self._rs * io * (1.0 if vi > 0.0 else -1.0)
+        if vout * vi <= 0.0:
             return 0.0, 0.0, 0.0, 0.0
-        loss = abs(vi - vout) * io
+        loss = self._rs * abs(io) * io
         pwr = abs(vi * ii)
-        return pwr, loss, _get_eff(pwr, pwr - loss, 100.0), loss * self._params["rt"]
-
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+        return pwr, loss, _get_eff(pwr, pwr - loss, 100.0), loss * self._rt
+
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        s = np.sign(vi)
+        vout = vi - prm["rs"] * io * s
+        on = vout * vi > 0.0
+        pwr = np.where(on, np.abs(vi * ii), 0.0)
+        loss = np.where(on, prm["rs"] * np.abs(io) * io, 0.0)
+        eff = np.where(on | (vi == 0.0), _vec_eff(pwr, pwr - loss, 100.0), 0.0)
+        return pwr, loss, eff, loss * prm["rt"]
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
         pl = abs(vi) * ii - abs(vo) * io
-        tr = pl * self._params["rt"]
+        tr = pl * self._rt
         return _get_warns(
-            self._limits,
+            self._lims,
             {
                 "vi": vi,
                 "vo": vo,
@@ -684,6 +1099,25 @@ class RLoss:
             },
         )
 
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        pl = np.abs(vi) * ii - np.abs(vo) * io
+        tr = pl * prm["rt"]
+        return _vec_warns(
+            lims,
+            {
+                "vi": vi,
+                "vo": vo,
+                "ii": ii,
+                "io": io,
+                "pi": np.abs(vi * ii),
+                "po": np.abs(vo * io),
+                "pl": pl,
+                "tr": tr,
+            },
+        )
+
     def _get_params(self, pdict):
         """Return dict with component parameters"""
         ret = pdict
@@ -692,6 +1126,7 @@ class RLoss:
         return ret
 
 
+@_ComponentInterface.register
 class VLoss:
     """Voltage loss.
 
@@ -718,17 +1153,10 @@ class VLoss:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the Loss component type"""
-        return _ComponentTypes.SLOSS
+    __slots__ = ("_params", "_limits", "_lims", "_ipr", "_vdrop_const", "_rt")
 
-    @property
-    def _child_types(self):
-        """Defines allowable Loss child component types"""
-        et = list(_ComponentTypes)
-        et.remove(_ComponentTypes.SOURCE)
-        return et
+    _component_type = _ComponentTypes.SLOSS
+    _child_types = _CHILD_TYPES_NOSOURCE
 
     def __init__(
         self,
@@ -736,29 +1164,22 @@ class VLoss:
         *,
         vdrop: float | dict,
         rt: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
     ):
         self._params = {}
         self._params["name"] = name
         self._params["rt"] = abs(rt)
+        self._rt = abs(rt)
         if isinstance(vdrop, dict):
-            if not np.all(np.diff(vdrop["io"]) > 0):
-                raise ValueError("io values must be monotonic increasing")
-            if len(vdrop["vi"]) == 1:
-                self._ipr = _Interp1d(vdrop["io"], vdrop["vdrop"][0])
-            else:
-                cur = []
-                volt = []
-                for v in vdrop["vi"]:
-                    cur += vdrop["io"]
-                    volt += len(vdrop["io"]) * [v]
-                    vd = np.asarray(vdrop["vdrop"]).reshape(1, -1)[0].tolist()
-                self._ipr = _Interp2d(cur, volt, vd)
+            self._ipr = _make_interp(vdrop, "vdrop")
+            self._vdrop_const = None
             self._params["vdrop"] = vdrop
         else:
             self._params["vdrop"] = abs(vdrop)
             self._ipr = _Interp0d(abs(vdrop))
-        self._limits = limits
+            self._vdrop_const = float(abs(vdrop))
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
 
     @classmethod
     def from_file(cls, name: str, *, fname: str):
@@ -771,32 +1192,34 @@ class VLoss:
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         vd = _get_mand(config["vloss"], "vdrop")
         rt = _get_opt(config["vloss"], "rt", RT_DEFAULT)
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         return cls(name, vdrop=vd, rt=rt, limits=lim)
 
-    def _get_inp_current(self, phase, phase_conf={}):
+    def _get_inp_current(self, phase, phase_conf=()):
         return 0.0
 
-    def _get_outp_voltage(self, phase, phase_conf={}):
+    def _get_outp_voltage(self, phase, phase_conf=()):
         return 0.0
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf={}):
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
-        if abs(vi) == 0.0:
+        if vi == 0.0:
             return 0.0
         return io
 
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf={}):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Calculate component output voltage from vi, ii and io"""
-        if abs(vi) == 0.0:
+        if vi == 0.0:
             return 0.0
-        vo = vi - self._ipr._interp(abs(io), abs(vi)) * np.sign(vi)
-        if np.sign(vo) == np.sign(vi):
+        vd = self._vdrop_const
+        if vd is None:
+            vd = self._ipr._interp(abs(io), abs(vi))
+        vo = vi - vd if vi > 0.0 else vi + vd
+        if vo * vi > 0.0:
             return vo
         raise ValueError(
             "Unstable system: VLoss component '{}' has zero output voltage".format(
@@ -804,21 +1227,61 @@ class VLoss:
             )
         )
 
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf={}):
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        return {
+            "name": [c._params["name"] for c in comps],
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "ipr": _vec_ipr(comps),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        return np.where(vi == 0.0, 0.0, io)
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Calculate output voltages of batched components"""
+        vdrop = _vec_interp(prm["ipr"], np.abs(io), np.abs(vi))
+        s = np.sign(vi)
+        vo = vi - vdrop * s
+        _vec_unstable(prm, s, vo, "VLoss")
+        return np.where(vi == 0.0, 0.0, vo)
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
-        vout = vi - self._ipr._interp(abs(io), abs(vi)) * np.sign(vi)
-        if np.sign(vout) != np.sign(vi):
+        if vi == 0.0:
+            return 0.0, 0.0, 100.0, 0.0
+        vd = self._vdrop_const
+        if vd is None:
+            vd = self._ipr._interp(abs(io), abs(vi))
+        vout = vi - vd if vi > 0.0 else vi + vd
+        if vout * vi <= 0.0:
             return 0.0, 0.0, 0.0, 0.0
         loss = abs(vi - vout) * io
         pwr = abs(vi * ii)
-        return pwr, loss, _get_eff(pwr, pwr - loss, 100.0), loss * self._params["rt"]
-
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf={}):
+        return pwr, loss, _get_eff(pwr, pwr - loss, 100.0), loss * self._rt
+
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        vdrop = _vec_interp(prm["ipr"], np.abs(io), np.abs(vi))
+        s = np.sign(vi)
+        vout = vi - vdrop * s
+        on = vout * vi > 0.0
+        pwr = np.where(on, np.abs(vi * ii), 0.0)
+        loss = np.where(on, np.abs(vi - vout) * io, 0.0)
+        eff = np.where(on | (vi == 0.0), _vec_eff(pwr, pwr - loss, 100.0), 0.0)
+        return pwr, loss, eff, loss * prm["rt"]
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
         """Check limits"""
         pl = abs(vi) * ii - abs(vo) * io
-        tr = pl * self._params["rt"]
+        tr = pl * self._rt
         return _get_warns(
-            self._limits,
+            self._lims,
             {
                 "vi": vi,
                 "vo": vo,
@@ -831,6 +1294,25 @@ class VLoss:
             },
         )
 
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components"""
+        pl = np.abs(vi) * ii - np.abs(vo) * io
+        tr = pl * prm["rt"]
+        return _vec_warns(
+            lims,
+            {
+                "vi": vi,
+                "vo": vo,
+                "ii": ii,
+                "io": io,
+                "pi": np.abs(vi * ii),
+                "po": np.abs(vo * io),
+                "pl": pl,
+                "tr": tr,
+            },
+        )
+
     def _get_annot(self):
         """Get interpolation figure annotations in format [xlabel, ylabel, title]"""
         if isinstance(self._ipr, _Interp1d):
@@ -850,12 +1332,13 @@ class VLoss:
         ret = pdict
         ret["rt"] = self._params["rt"]
         if isinstance(self._ipr, _Interp0d):
-            ret["vdrop"] = abs(self._params["vdrop"])
+            ret["vdrop"] = self._params["vdrop"]
         else:
             ret["vdrop"] = "interp"
         return ret
 
 
+@_ComponentInterface.register
 class Converter:
     """Voltage converter.
 
@@ -892,17 +1375,20 @@ class Converter:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the Converter component type"""
-        return _ComponentTypes.CONVERTER
-
-    @property
-    def _child_types(self):
-        """Defines allowable Converter child component types"""
-        et = list(_ComponentTypes)
-        et.remove(_ComponentTypes.SOURCE)
-        return et
+    __slots__ = (
+        "_params",
+        "_limits",
+        "_lims",
+        "_ipr",
+        "_eff_const",
+        "_vo",
+        "_iq",
+        "_iis",
+        "_rt",
+    )
+
+    _component_type = _ComponentTypes.CONVERTER
+    _child_types = _CHILD_TYPES_NOSOURCE
 
     def __init__(
         self,
@@ -911,7 +1397,7 @@ class Converter:
         vo: float,
         eff: float | dict,
         iq: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
         iis: float = 0.0,
         rt: float = 0.0,
     ):
@@ -919,33 +1405,30 @@ class Converter:
         self._params["name"] = name
         self._params["vo"] = vo
         if isinstance(eff, dict):
-            if not np.all(np.diff(eff["io"]) > 0):
-                raise ValueError("io values must be monotonic increasing")
-            if np.min(eff["eff"]) <= 0.0:
+            effs = np.asarray(eff["eff"], dtype=float)
+            if np.min(effs) <= 0.0:
                 raise ValueError("Efficiency values must be > 0.0")
-            if np.max(eff["eff"]) > 1.0:
+            if np.max(effs) > 1.0:
                 raise ValueError("Efficiency values must be <= 1.0")
-            if len(eff["vi"]) == 1:
-                self._ipr = _Interp1d(eff["io"], eff["eff"][0])
-            else:
-                cur = []
-                volt = []
-                for v in eff["vi"]:
-                    cur += eff["io"]
-                    volt += len(eff["io"]) * [v]
-                    ef = np.asarray(eff["eff"]).reshape(1, -1)[0].tolist()
-                self._ipr = _Interp2d(cur, volt, ef)
+            self._ipr = _make_interp(eff, "eff")
+            self._eff_const = None
         else:
             if not (eff > 0.0):
                 raise ValueError("Efficiency must be > 0.0")
             if not (eff <= 1.0):
                 raise ValueError("Efficiency must be <= 1.0")
             self._ipr = _Interp0d(eff)
+            self._eff_const = float(eff)
         self._params["eff"] = eff
         self._params["iq"] = abs(iq)
         self._params["iis"] = abs(iis)
         self._params["rt"] = abs(rt)
-        self._limits = limits
+        self._vo = vo
+        self._iq = abs(iq)
+        self._iis = abs(iis)
+        self._rt = abs(rt)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
 
     @classmethod
     def from_file(cls, name: str, *, fname: str):
@@ -959,77 +1442,107 @@ class Converter:
             File name.
 
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         v = _get_mand(config["converter"], "vo")
         e = _get_mand(config["converter"], "eff")
         iq = _get_opt(config["converter"], "iq", IQ_DEFAULT)
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         iis = _get_opt(config["converter"], "iis", IIS_DEFAULT)
         rt = _get_opt(config["converter"], "rt", RT_DEFAULT)
         return cls(name, vo=v, eff=e, iq=iq, limits=lim, iis=iis, rt=rt)
 
-    def _get_inp_current(self, phase, phase_conf=[]):
-        i = self._params["iq"]
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            i = self._params["iis"]
-        return i
+    def _get_inp_current(self, phase, phase_conf=()):
+        if phase_conf and phase not in phase_conf:
+            return self._iis
+        return self._iq
 
-    def _get_outp_voltage(self, phase, phase_conf=[]):
-        v = self._params["vo"]
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            v = 0.0
-        return v
+    def _get_outp_voltage(self, phase, phase_conf=()):
+        if phase_conf and phase not in phase_conf:
+            return 0.0
+        return self._vo
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=[]):
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
-        if abs(vi) == 0.0 or self._params["vo"] == 0.0:
+        if vi == 0.0 or self._vo == 0.0:
             return 0.0
-        ve = vi * self._ipr._interp(abs(io), abs(vi))
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            return self._params["iis"]
+        if phase_conf and phase not in phase_conf:
+            return self._iis
         if io == 0.0:
-            return self._params["iq"]
-        return abs(self._params["vo"] * io / ve)
+            return self._iq
+        eff = self._eff_const
+        if eff is None:
+            eff = self._ipr._interp(abs(io), abs(vi))
+        return abs(self._vo * io / (vi * eff))
 
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=[]):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Calculate component output voltage from vi, ii and io"""
-        v = self._params["vo"]
-        if vi == 0.0:
-            v = 0.0
-        if phase_conf:
-            if phase not in phase_conf:
-                v = 0.0
-        return v
-
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=[]):
+        if vi == 0.0 or (phase_conf and phase not in phase_conf):
+            return 0.0
+        return self._vo
+
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        return {
+            "vo": np.array([c._vo for c in comps], dtype=float),
+            "iq": np.array([c._iq for c in comps], dtype=float),
+            "iis": np.array([c._iis for c in comps], dtype=float),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "off": np.array([_is_off(phase, pc) for pc in phase_confs], dtype=bool),
+            "ipr": _vec_ipr(comps),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        ve = vi * _vec_interp(prm["ipr"], np.abs(io), np.abs(vi))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            i = np.where(io == 0.0, prm["iq"], np.abs(prm["vo"] * io / ve))
+        i = np.where(prm["off"], prm["iis"], i)
+        return np.where((vi == 0.0) | (prm["vo"] == 0.0), 0.0, i)
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Calculate output voltages of batched components"""
+        return np.where((vi == 0.0) | prm["off"], 0.0, prm["vo"])
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
+        if vi == 0.0:
+            return 0.0, 0.0, 0.0, 0.0
+        if phase_conf and phase not in phase_conf:
+            pwr = abs(self._iis * vi)
+            return pwr, pwr, _get_eff(pwr, 0.0, 0.0), pwr * self._rt
+        pwr = abs(vi * ii)
         if io == 0.0:
-            loss = abs(self._params["iq"] * vi)
+            loss = abs(self._iq * vi)
         else:
-            loss = abs(ii * vi * (1.0 - self._ipr._interp(abs(io), abs(vi))))
-        pwr = abs(vi * ii)
-        if phase_conf:
-            if phase not in phase_conf:
-                loss = abs(self._params["iis"] * vi)
-                pwr = abs(self._params["iis"] * vi)
-        return pwr, loss, _get_eff(pwr, pwr - loss, 0.0), loss * self._params["rt"]
-
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=[]):
-        """Check limits"""
-        if phase_conf:
-            if phase not in phase_conf:
-                return ""
-        pi, pl, _, tr = self._solv_pwr_loss(vi, vo, ii, io, phase, phase_conf=[])
+            eff = self._eff_const
+            if eff is None:
+                eff = self._ipr._interp(abs(io), abs(vi))
+            loss = pwr * (1.0 - eff)
+        return pwr, loss, _get_eff(pwr, pwr - loss, 0.0), loss * self._rt
+
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        eff = _vec_interp(prm["ipr"], np.abs(io), np.abs(vi))
+        pwr = np.abs(vi * ii)
+        loss = np.where(io == 0.0, np.abs(prm["iq"] * vi), pwr * (1.0 - eff))
+        loss = np.where(prm["off"], np.abs(prm["iis"] * vi), loss)
+        pwr = np.where(prm["off"], np.abs(prm["iis"] * vi), pwr)
+        return pwr, loss, _vec_eff(pwr, pwr - loss, 0.0), loss * prm["rt"]
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
+        """Check limits, ploss is the result of _solv_pwr_loss() if already calculated"""
+        if phase_conf and phase not in phase_conf:
+            return ""
+        if ploss is None:
+            ploss = self._solv_pwr_loss(vi, vo, ii, io, phase, phase_conf=())
+        pi, pl, _, tr = ploss
         return _get_warns(
-            self._limits,
+            self._lims,
             {
                 "vi": vi,
                 "vo": vo,
@@ -1042,6 +1555,25 @@ class Converter:
             },
         )
 
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components, ploss is the result of _vec_pwr_loss()"""
+        pi, pl, _, tr = ploss
+        return _vec_warns(
+            lims,
+            {
+                "vi": vi,
+                "vo": vo,
+                "ii": ii,
+                "io": io,
+                "pi": pi,
+                "po": pi - pl,
+                "pl": pl,
+                "tr": tr,
+            },
+            prm["off"],
+        )
+
     def _get_annot(self):
         """Get interpolation figure annotations in format [xlabel, ylabel, title]"""
         if isinstance(self._ipr, _Interp1d):
@@ -1064,7 +1596,7 @@ class Converter:
         ret["vo"] = self._params["vo"]
         ret["iq"] = self._params["iq"]
         if isinstance(self._ipr, _Interp0d):
-            ret["eff"] = abs(self._params["eff"])
+            ret["eff"] = self._params["eff"]
         else:
             ret["eff"] = "interp"
         ret["iis"] = self._params["iis"]
@@ -1072,6 +1604,7 @@ class Converter:
         return ret
 
 
+@_ComponentInterface.register
 class LinReg:
     """Linear voltage regulator.
 
@@ -1110,17 +1643,22 @@ class LinReg:
 
     """
 
-    @property
-    def _component_type(self):
-        """Defines the LinReg component type"""
-        return _ComponentTypes.LINREG
-
-    @property
-    def _child_types(self):
-        """Defines allowable LinReg child component types"""
-        et = list(_ComponentTypes)
-        et.remove(_ComponentTypes.SOURCE)
-        return et
+    __slots__ = (
+        "_params",
+        "_limits",
+        "_lims",
+        "_ipr",
+        "_ig_const",
+        "_vo",
+        "_vo_abs",
+        "_vo_sign",
+        "_vdrop",
+        "_iis",
+        "_rt",
+    )
+
+    _component_type = _ComponentTypes.LINREG
+    _child_types = _CHILD_TYPES_NOSOURCE
 
     def __init__(
         self,
@@ -1129,7 +1667,7 @@ class LinReg:
         vo: float,
         vdrop: float = 0.0,
         iq: float = 0.0,
-        limits: dict = LIMITS_DEFAULT,
+        limits: dict = None,
         iis: float = 0.0,
         rt: float = 0.0,
     ):
@@ -1140,26 +1678,24 @@ class LinReg:
             raise ValueError("Voltage drop must be < vo")
         self._params["vdrop"] = abs(vdrop)
         if isinstance(iq, dict):
-            if not np.all(np.diff(iq["io"]) > 0):
-                raise ValueError("iq values must be monotonic increasing")
             if np.min(iq["iq"]) < 0.0:
                 raise ValueError("iq values must be >= 0.0")
-            if len(iq["vi"]) == 1:
-                self._ipr = _Interp1d(iq["io"], iq["iq"][0])
-            else:
-                cur = []
-                volt = []
-                for v in iq["vi"]:
-                    cur += iq["io"]
-                    volt += len(iq["io"]) * [v]
-                    iqi = np.asarray(iq["iq"]).reshape(1, -1)[0].tolist()
-                self._ipr = _Interp2d(cur, volt, iqi)
+            self._ipr = _make_interp(iq, "iq")
+            self._ig_const = None
         else:
             self._ipr = _Interp0d(abs(iq))
+            self._ig_const = float(abs(iq))
         self._params["iq"] = iq
         self._params["iis"] = abs(iis)
         self._params["rt"] = abs(rt)
-        self._limits = limits
+        self._vo = vo
+        self._vo_abs = abs(vo)
+        self._vo_sign = 1.0 if vo >= 0.0 else -1.0
+        self._vdrop = abs(vdrop)
+        self._iis = abs(iis)
+        self._rt = abs(rt)
+        self._limits = _get_limits(limits)
+        self._lims = _get_lims(self._limits)
 
     @classmethod
     def from_file(cls, name: str, *, fname: str):
@@ -1172,80 +1708,134 @@ class LinReg:
         fname : str
             File name.
         """
-        with open(fname, "r") as f:
-            config = toml.load(f)
+        config = _load_toml(fname)
 
         v = _get_mand(config["linreg"], "vo")
         vd = _get_opt(config["linreg"], "vdrop", VDROP_DEFAULT)
         iq = _get_opt(config["linreg"], "iq", IQ_DEFAULT)
-        lim = _get_opt(config, "limits", LIMITS_DEFAULT)
+        lim = _get_opt(config, "limits", None)
         iis = _get_opt(config["linreg"], "iis", IIS_DEFAULT)
         rt = _get_opt(config["linreg"], "rt", RT_DEFAULT)
         return cls(name, vo=v, vdrop=vd, iq=iq, limits=lim, iis=iis, rt=rt)
 
-    def _get_inp_current(self, phase, phase_conf=[]):
-        i = self._ipr._interp(0.0, 0.0)
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            i = self._params["iis"]
-        return i
+    def _get_inp_current(self, phase, phase_conf=()):
+        if phase_conf and phase not in phase_conf:
+            return self._iis
+        if self._ig_const is not None:
+            return self._ig_const
+        return self._ipr._interp(0.0, 0.0)
 
-    def _get_outp_voltage(self, phase, phase_conf=[]):
-        v = self._params["vo"]
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            v = 0.0
-        return v
+    def _get_outp_voltage(self, phase, phase_conf=()):
+        if phase_conf and phase not in phase_conf:
+            return 0.0
+        return self._vo
 
-    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=[]):
+    def _solv_inp_curr(self, vi, vo, io, phase, phase_conf=()):
         """Calculate component input current from vi, vo and io"""
-        if abs(vi) == 0.0:
+        if vi == 0.0:
             return 0.0
-        i = io + self._ipr._interp(abs(io), abs(vi))
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            i = self._params["iis"]
-        return i
+        if phase_conf and phase not in phase_conf:
+            return self._iis
+        if self._ig_const is not None:
+            return io + self._ig_const
+        return io + self._ipr._interp(abs(io), abs(vi))
 
-    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=[]):
+    def _solv_outp_volt(self, vi, ii, io, phase, phase_conf=()):
         """Calculate component output voltage from vi, ii and io"""
-        v = min(abs(self._params["vo"]), max(abs(vi) - self._params["vdrop"], 0.0))
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
+        if phase_conf and phase not in phase_conf:
             v = 0.0
-        if self._params["vo"] >= 0.0:
-            return v
-        return -v
-
-    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=[]):
+        else:
+            v = min(self._vo_abs, max(abs(vi) - self._vdrop, 0.0))
+        return self._vo_sign * v
+
+    @staticmethod
+    def _vec_params(comps, phase, phase_confs):
+        """Get component parameter arrays for batched solver"""
+        return {
+            "vo": np.array([c._vo for c in comps], dtype=float),
+            "avo": np.array([c._vo_abs for c in comps], dtype=float),
+            "sign": np.array([c._vo_sign for c in comps], dtype=float),
+            "vdrop": np.array([c._vdrop for c in comps], dtype=float),
+            "iis": np.array([c._iis for c in comps], dtype=float),
+            "rt": np.array([c._rt for c in comps], dtype=float),
+            "off": np.array([_is_off(phase, pc) for pc in phase_confs], dtype=bool),
+            "ipr": _vec_ipr(comps),
+        }
+
+    @staticmethod
+    def _vec_inp_curr(prm, vi, vo, io):
+        """Calculate input currents of batched components"""
+        i = io + _vec_interp(prm["ipr"], np.abs(io), np.abs(vi))
+        i = np.where(prm["off"], prm["iis"], i)
+        return np.where(vi == 0.0, 0.0, i)
+
+    @staticmethod
+    def _vec_outp_volt(prm, vi, ii, io):
+        """Calculate output voltages of batched components"""
+        v = np.minimum(prm["avo"], np.maximum(np.abs(vi) - prm["vdrop"], 0.0))
+        v = np.where(prm["off"], 0.0, v)
+        return prm["sign"] * v
+
+    def _solv_pwr_loss(self, vi, vo, ii, io, phase, phase_conf=()):
         """Calculate power and loss in component"""
-        v = min(abs(self._params["vo"]), max(abs(vi) - self._params["vdrop"], 0.0))
-        if vi == 0.0 or v == 0.0:
+        if vi == 0.0:
+            return 0.0, 0.0, 0.0, 0.0
+        if phase_conf and phase not in phase_conf:
+            pwr = abs(self._iis * vi)
+            return pwr, pwr, _get_eff(pwr, 0.0, 0.0), pwr * self._rt
+        avi = abs(vi)
+        v = min(self._vo_abs, max(avi - self._vdrop, 0.0))
+        if v == 0.0:
             loss = 0.0
+        elif self._ig_const is not None:
+            loss = self._ig_const * avi
         else:
-            loss = self._ipr._interp(abs(io), abs(vi)) * abs(vi)
-        if abs(io) > 0.0:
-            loss += (abs(vi) - abs(v)) * io
+            loss = self._ipr._interp(abs(io), avi) * avi
+        if io != 0.0:
+            loss += (avi - v) * io
         pwr = abs(vi * ii)
-        if not phase_conf:
-            pass
-        elif phase not in phase_conf:
-            loss = abs(self._params["iis"] * vi)
-            pwr = abs(self._params["iis"] * vi)
-        return pwr, loss, _get_eff(pwr, pwr - loss, 0.0), loss * self._params["rt"]
-
-    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=[]):
-        """Check limits"""
-        if phase_conf:
-            if phase not in phase_conf:
-                return ""
-        pi, pl, _, tr = self._solv_pwr_loss(vi, vo, ii, io, phase, phase_conf=[])
+        return pwr, loss, _get_eff(pwr, pwr - loss, 0.0), loss * self._rt
+
+    @staticmethod
+    def _vec_pwr_loss(prm, vi, vo, ii, io):
+        """Calculate power and loss in batched components"""
+        avi = np.abs(vi)
+        v = np.minimum(prm["avo"], np.maximum(avi - prm["vdrop"], 0.0))
+        iq = _vec_interp(prm["ipr"], np.abs(io), avi)
+        loss = np.where((vi == 0.0) | (v == 0.0), 0.0, iq * avi)
+        loss = np.where(io != 0.0, loss + (avi - v) * io, loss)
+        pwr = np.abs(vi * ii)
+        loss = np.where(prm["off"], np.abs(prm["iis"] * vi), loss)
+        pwr = np.where(prm["off"], np.abs(prm["iis"] * vi), pwr)
+        return pwr, loss, _vec_eff(pwr, pwr - loss, 0.0), loss * prm["rt"]
+
+    def _solv_get_warns(self, vi, vo, ii, io, phase, phase_conf=(), ploss=None):
+        """Check limits, ploss is the result of _solv_pwr_loss() if already calculated"""
+        if phase_conf and phase not in phase_conf:
+            return ""
+        if ploss is None:
+            ploss = self._solv_pwr_loss(vi, vo, ii, io, phase, phase_conf=())
+        pi, pl, _, tr = ploss
         return _get_warns(
-            self._limits,
+            self._lims,
+            {
+                "vi": vi,
+                "vo": vo,
+                "ii": ii,
+                "io": io,
+                "pi": pi,
+                "po": pi - pl,
+                "pl": pl,
+                "tr": tr,
+            },
+        )
+
+    @staticmethod
+    def _vec_get_warns(prm, lims, vi, vo, ii, io, ploss):
+        """Check limits of batched components, ploss is the result of _vec_pwr_loss()"""
+        pi, pl, _, tr = ploss
+        return _vec_warns(
+            lims,
             {
                 "vi": vi,
                 "vo": vo,
@@ -1256,6 +1846,7 @@ class LinReg:
                 "pl": pl,
                 "tr": tr,
             },
+            prm["off"],
         )
 
     def _get_annot(self):
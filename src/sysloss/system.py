@@ -29,10 +29,6 @@ from rich.tree import Tree
 from rich import print
 import json
 import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-from matplotlib.ticker import LinearLocator
-from scipy.interpolate import LinearNDInterpolator
 from typing import Callable
 import warnings
 from tqdm import TqdmExperimentalWarning
@@ -46,6 +42,7 @@ from sysloss.components import (
     _get_opt,
     _get_mand,
     _get_eff,
+    _vec_lims,
     _Interp0d,
     _Interp1d,
     _Interp2d,
@@ -54,6 +51,201 @@ from sysloss.components import (
 )
 import sysloss
 
+BATCH_MIN_NODES = 100  # smaller systems are solved one component at a time
+
+
+class _BatchedSolver:
+    """Solver for one system phase, components of same type are solved as arrays.
+
+    Parameters
+    ----------
+    g : rx.PyDiGraph
+        System graph.
+    nodes : list
+        Nodes in topological order.
+    parents : list
+        Parent of each node.
+    childs : list
+        Children of each node.
+    phase_lkup : dict
+        Phase configuration of each node.
+    phase : str
+        Load phase.
+
+    """
+
+    def __init__(self, g, nodes, parents, childs, phase_lkup, phase):
+        self._size = max(nodes) + 1
+        self._par = np.arange(self._size)
+        self._root = np.zeros(self._size, dtype=bool)
+        self._leaf = np.zeros(self._size, dtype=bool)
+        self._rs = np.zeros(self._size)
+        chl, groups = [], {}
+        for n in nodes:
+            if parents[n] == -1:
+                self._root[n] = True
+                self._rs[n] = g[n]._rs
+            else:
+                self._par[n] = parents[n][0]
+                chl += [n]
+            if childs[n] == -1:
+                self._leaf[n] = True
+            # constant and interpolated parameters are solved in separate groups
+            groups.setdefault((type(g[n]), type(g[n]._ipr)), []).append(n)
+        self._chl = np.array(chl, dtype=np.intp)
+        self._chp = self._par[self._chl]
+        self._phase = phase
+        self._groups, self._comps, self._confs = [], [], []
+        for (cls, _), idx in groups.items():
+            comps = [g[n] for n in idx]
+            confs = [phase_lkup[n] for n in idx]
+            prm = cls._vec_params(comps, phase, confs)
+            self._groups += [(cls, np.array(idx, dtype=np.intp), prm)]
+            self._comps += [comps]
+            self._confs += [confs]
+
+    def _update(self, n):
+        """Reload parameters of node n after its component has been changed in place"""
+        for k, (cls, idx, _) in enumerate(self._groups):
+            pos = np.flatnonzero(idx == n)
+            if len(pos) > 0:
+                comps = self._comps[k]
+                prm = cls._vec_params(comps, self._phase, self._confs[k])
+                self._groups[k] = (cls, idx, prm)
+                if self._root[n]:
+                    self._rs[n] = comps[pos[0]]._rs
+
+    def _isum(self, i):
+        """Sum of currents into childs"""
+        return np.bincount(self._chp, weights=i[self._chl], minlength=self._size)
+
+    def _fwd_prop(self, v, i):
+        """Forward propagation of voltages"""
+        vi = np.where(self._root, 0.0, v[self._par])
+        ii = np.where(self._root, 0.0, i)
+        io = self._isum(i)
+        vo = np.zeros(self._size)
+        for cls, idx, prm in self._groups:
+            vo[idx] = cls._vec_outp_volt(prm, vi[idx], ii[idx], io[idx])
+        return vo
+
+    def _back_prop(self, v, i):
+        """Backward propagation of currents"""
+        vi = v[self._par]
+        vo = np.where(self._leaf, 0.0, v)
+        io = self._isum(i)
+        ii = np.zeros(self._size)
+        for cls, idx, prm in self._groups:
+            ii[idx] = cls._vec_inp_curr(prm, vi[idx], vo[idx], io[idx])
+        return ii
+
+    def _inp_outp(self, v, i):
+        """Input voltages and output currents of all nodes"""
+        vi = np.where(self._root, v + self._rs * i, v[self._par])
+        io = np.where(self._root, i, self._isum(i))
+        return vi, io
+
+    def _pwr_loss(self, v, i):
+        """Calculate power, loss, efficiency and temperature rise of all nodes"""
+        v, i = np.asarray(v, dtype=float), np.asarray(i, dtype=float)
+        vi, io = self._inp_outp(v, i)
+        res = np.zeros((4, self._size))
+        for cls, idx, prm in self._groups:
+            res[:, idx] = cls._vec_pwr_loss(prm, vi[idx], v[idx], i[idx], io[idx])
+        return res.tolist()
+
+    def _warns(self, v, i, ploss):
+        """Check limits of all nodes, ploss is the result of _pwr_loss()"""
+        v, i = np.asarray(v, dtype=float), np.asarray(i, dtype=float)
+        vi, io = self._inp_outp(v, i)
+        ploss = np.asarray(ploss, dtype=float)
+        warns = [""] * self._size
+        for (cls, idx, prm), comps in zip(self._groups, self._comps):
+            w = cls._vec_get_warns(
+                prm, _vec_lims(comps), vi[idx], v[idx], i[idx], io[idx], ploss[:, idx]
+            )
+            for n, wn in zip(idx.tolist(), w):
+                warns[n] = wn
+        return warns
+
+
+class _ScalarSolver:
+    """Solver for one system phase, components are solved one at a time.
+
+    Faster than :py:class:`_BatchedSolver` for small systems, where the array
+    overhead of each component group outweighs the per-node loop. Takes the same
+    parameters as :py:class:`_BatchedSolver`.
+
+    """
+
+    def __init__(self, g, nodes, parents, childs, phase_lkup, phase):
+        self._size = max(nodes) + 1
+        self._phase = phase
+        # (node, component, parent, childs, phase config) in topological order
+        self._nodes = []
+        for n in nodes:
+            p = -1 if parents[n] == -1 else parents[n][0]
+            c = () if childs[n] == -1 else tuple(childs[n])
+            self._nodes += [(n, g[n], p, c, phase_lkup[n])]
+
+    def _update(self, n):
+        """Components are read directly, nothing to reload"""
+
+    def _fwd_prop(self, v, i):
+        """Forward propagation of voltages"""
+        v, i = v.tolist(), i.tolist()
+        vo = [0.0] * self._size
+        for n, comp, p, c, pc in self._nodes:
+            isum = 0.0
+            for k in c:
+                isum += i[k]
+            if p == -1:  # root
+                vo[n] = comp._solv_outp_volt(0.0, 0.0, isum, self._phase, pc)
+            else:
+                vo[n] = comp._solv_outp_volt(v[p], i[n], isum, self._phase, pc)
+        return np.array(vo)
+
+    def _back_prop(self, v, i):
+        """Backward propagation of currents"""
+        v, i = v.tolist(), i.tolist()
+        ii = [0.0] * self._size
+        for n, comp, p, c, pc in reversed(self._nodes):
+            isum = 0.0
+            for k in c:
+                isum += i[k]
+            vi = v[n] if p == -1 else v[p]
+            vo = v[n] if c else 0.0
+            ii[n] = comp._solv_inp_curr(vi, vo, isum, self._phase, pc)
+        return np.array(ii)
+
+    def _inp_outp(self, v, i):
+        """Input voltage and output current of each node"""
+        for n, comp, p, c, pc in self._nodes:
+            if p == -1:  # root
+                yield n, comp, pc, v[n] + comp._rs * i[n], i[n]
+            else:
+                io = 0.0
+                for k in c:
+                    io += i[k]
+                yield n, comp, pc, v[p], io
+
+    def _pwr_loss(self, v, i):
+        """Calculate power, loss, efficiency and temperature rise of all nodes"""
+        res = [[0.0] * self._size for _ in range(4)]
+        for n, comp, pc, vi, io in self._inp_outp(v, i):
+            r = comp._solv_pwr_loss(vi, v[n], i[n], io, self._phase, pc)
+            for k in range(4):
+                res[k][n] = r[k]
+        return res
+
+    def _warns(self, v, i, ploss):
+        """Check limits of all nodes, ploss is the result of _pwr_loss()"""
+        warns = [""] * self._size
+        for n, comp, pc, vi, io in self._inp_outp(v, i):
+            pl = tuple(ploss[k][n] for k in range(4))
+            warns[n] = comp._solv_get_warns(vi, v[n], i[n], io, self._phase, pc, pl)
+        return warns
+
 
 class System:
     """System to be analyzed.
@@ -92,6 +284,7 @@ class System:
         self._g.attrs["phase_conf"][source._params["name"]] = {}
         self._g.attrs["nodes"] = {}
         self._g.attrs["nodes"][source._params["name"]] = pidx
+        self._solvers = {}
 
     @classmethod
     def from_file(cls, fname: str):
@@ -503,10 +696,11 @@ class System:
         print(t)
 
     def _set_phase_lkup(self):
-        """Make lookup from node # to load phases"""
+        """Make lookup from node # to load phases, phase lists are stored as sets"""
         self._phase_lkup = {}
         for c in self._g.attrs["phase_conf"].items():
-            self._phase_lkup[self._get_index(c[0])] = c[1]
+            pc = frozenset(c[1]) if isinstance(c[1], list) else c[1]
+            self._phase_lkup[self._get_index(c[0])] = pc
 
     def _sys_init(self, phase: str = ""):
         """Create vectors of init values for solver"""
@@ -517,105 +711,12 @@ class System:
             i[n] = self._g[n]._get_inp_current(phase, self._phase_lkup[n])
         return v, i
 
-    def _fwd_prop(self, v: float, i: float, phase: str = ""):
-        """Forward propagation of voltages"""
-        vo, _ = self._sys_vars()
-        # update output voltages (per node)
-        for n in self._topo_nodes:
-            p = self._parents[n]
-            phase_config = self._phase_lkup[n]
-            if self._childs[n] == -1:  # leaf
-                if p == -1:  # root
-                    vo[n] = self._g[n]._solv_outp_volt(
-                        0.0,
-                        0.0,
-                        0.0,
-                        phase,
-                        phase_config,
-                    )
-                else:
-                    vo[n] = self._g[n]._solv_outp_volt(
-                        v[p[0]],
-                        i[n],
-                        0.0,
-                        phase,
-                        phase_config,
-                    )
-            else:
-                # add currents into childs
-                isum = 0
-                for c in self._childs[n]:
-                    isum += i[c]
-                if p == -1:  # root
-                    vo[n] = self._g[n]._solv_outp_volt(
-                        0.0,
-                        0.0,
-                        isum,
-                        phase,
-                        phase_config,
-                    )
-                else:
-                    vo[n] = self._g[n]._solv_outp_volt(
-                        v[p[0]],
-                        i[n],
-                        isum,
-                        phase,
-                        phase_config,
-                    )
-        return vo
-
-    def _back_prop(self, v: float, i: float, phase: str = ""):
-        """Backward propagation of currents"""
-        _, ii = self._sys_vars()
-        # update input currents (per node)
-        for n in self._topo_nodes[::-1]:
-            p = self._parents[n]
-            phase_config = self._phase_lkup[n]
-            if self._childs[n] == -1:  # leaf
-                if p == -1:  # root
-                    ii[n] = self._g[n]._solv_inp_curr(
-                        v[n],
-                        0.0,
-                        0.0,
-                        phase,
-                        phase_config,
-                    )
-                else:
-                    ii[n] = self._g[n]._solv_inp_curr(
-                        v[p[0]],
-                        0.0,
-                        0.0,
-                        phase,
-                        phase_config,
-                    )
-            else:
-                isum = 0.0
-                for c in self._childs[n]:
-                    isum += i[c]
-                if p == -1:  # root
-                    ii[n] = self._g[n]._solv_inp_curr(
-                        v[n],
-                        v[n],
-                        isum,
-                        phase,
-                        phase_config,
-                    )
-                else:
-                    ii[n] = self._g[n]._solv_inp_curr(
-                        v[p[0]],
-                        v[n],
-                        isum,
-                        phase,
-                        phase_config,
-                    )
-
-        return ii
-
     def _rel_update(self):
         """Update lists with component relationships"""
         self._parents = self._get_parents()
         self._childs = self._get_childs()
         self._topo_nodes = self._get_topo_sort()
+        self._solvers = {}
 
     def _get_parent_name(self, node):
         """Get parent name of node"""
@@ -623,17 +724,33 @@ class System:
             return ""
         return self._g[self._parents[node][0]]._params["name"]
 
+    def _get_solver(self, phase: str = ""):
+        """Get solver of load phase, built once per topology and phase"""
+        if phase not in self._solvers:
+            solver = _ScalarSolver
+            if len(self._topo_nodes) >= BATCH_MIN_NODES:
+                solver = _BatchedSolver
+            self._solvers[phase] = solver(
+                self._g,
+                self._topo_nodes,
+                self._parents,
+                self._childs,
+                self._phase_lkup,
+                phase,
+            )
+        return self._solvers[phase]
+
     def _solve(self, vtol=1e-5, itol=1e-6, maxiter=10000, quiet=True, phase: str = ""):
         """Solver"""
         v, i = self._sys_init(phase)
+        v, i = np.asarray(v, dtype=float), np.asarray(i, dtype=float)
+        bs = self._get_solver(phase)
         iters = 0
         while iters <= maxiter:
-            vi = self._fwd_prop(v, i, phase)
-            ii = self._back_prop(vi, i, phase)
+            vi = bs._fwd_prop(v, i)
+            ii = bs._back_prop(vi, i)
             iters += 1
-            if np.allclose(np.array(v), np.array(vi), rtol=vtol) and np.allclose(
-                np.array(i), np.array(ii), rtol=itol
-            ):
+            if np.allclose(v, vi, rtol=vtol) and np.allclose(i, ii, rtol=itol):
                 if not quiet:
                     pname = ""
                     if phase != "":
@@ -641,7 +758,7 @@ class System:
                     print("{}Tolerances met after {} iterations".format(pname, iters))
                 break
             v, i = vi, ii
-        return v, i, iters
+        return v.tolist(), i.tolist(), iters
 
     def _calc_energy(self, phase, pwr):
         """Calculate energy per 24h"""
@@ -662,7 +779,7 @@ class System:
         quiet: bool = True,
         phase: str = "",
         energy: bool = False,
-        tags: dict = {},
+        tags: dict = None,
     ) -> pd.DataFrame:
         """Analyze steady-state of system.
 
@@ -722,26 +839,27 @@ class System:
                     "Steady-state not achieved after {} iterations".format(iters - 1)
                 )
             # calculate results for each node
+            bs = self._get_solver(ph)
+            bpwr, bloss, beff, btr = bres = bs._pwr_loss(v, i)
+            bwarn = bs._warns(v, i, bres)
             names, parent, typ, pwr, loss, trise = [], [], [], [], [], []
             eff, warn, vsi, iso, vso, isi = [], [], [], [], [], []
             domain, phases, ener, dname = [], [], [], "none"
             sources, dwarns = {}, {}
             show_trise = False
             for n in self._topo_nodes:  # [vi, vo, ii, io]
-                phase_config = self._phase_lkup[n]
                 names += [self._g[n]._params["name"]]
                 if self._g[n]._component_type.name == "SOURCE":
                     dname = self._g[n]._params["name"]
                 domain += [dname]
                 phases += [ph]
                 vi = v[n]
-                vo = v[n]
                 ii = i[n]
                 io = i[n]
                 p = self._parents[n]
 
                 if p == -1:  # root
-                    vi = v[n] + self._g[n]._params["rs"] * ii
+                    vi = v[n] + self._g[n]._rs * ii
                 elif self._childs[n] == -1:  # leaf
                     vi = v[p[0]]
                     io = 0.0
@@ -751,9 +869,7 @@ class System:
                         io += i[c]
                     vi = v[p[0]]
                 parent += [self._get_parent_name(n)]
-                p, l, e, tr = self._g[n]._solv_pwr_loss(
-                    vi, vo, ii, io, ph, phase_config
-                )
+                p, l, e, tr = bpwr[n], bloss[n], beff[n], btr[n]
                 pwr += [p]
                 loss += [l]
                 if self._g[n]._component_type.name == "SOURCE":
@@ -768,7 +884,7 @@ class System:
                 if self._g[n]._component_type.name == "SOURCE":
                     sources[dname] = vi
                     dwarns[dname] = 0
-                w = self._g[n]._solv_get_warns(vi, vo, ii, io, ph, phase_config)
+                w = bwarn[n]
                 warn += [w]
                 if w != "":
                     dwarns[dname] = 1
@@ -824,7 +940,7 @@ class System:
             res["Type"] = typ
             res["Parent"] = parent
             res["Domain"] = domain
-            if tags != {}:
+            if tags:
                 for key in tags.keys():
                     res[key] = [tags[key]] * len(names)
             if ph != "":
@@ -900,7 +1016,7 @@ class System:
             if energy:
                 vals += [self._calc_energy("", apwr)]
                 idxs += ["24h energy (Wh)"]
-            if tags != {}:
+            if tags:
                 for key in tags.keys():
                     idxs += [key]
                     vals += [tags[key]]
@@ -967,14 +1083,14 @@ class System:
             pwrs += [cparams["pwrs"]]
             parent += [self._get_parent_name(n)]
             if limits:
-                lii += [_get_opt(self._g[n]._limits, "ii", LIMITS_DEFAULT["ii"])]
-                lio += [_get_opt(self._g[n]._limits, "io", LIMITS_DEFAULT["io"])]
-                lvi += [_get_opt(self._g[n]._limits, "vi", LIMITS_DEFAULT["vi"])]
-                lvo += [_get_opt(self._g[n]._limits, "vo", LIMITS_DEFAULT["vo"])]
-                lpi += [_get_opt(self._g[n]._limits, "pi", LIMITS_DEFAULT["pi"])]
-                lpo += [_get_opt(self._g[n]._limits, "po", LIMITS_DEFAULT["po"])]
-                lpl += [_get_opt(self._g[n]._limits, "pl", LIMITS_DEFAULT["pl"])]
-                lrt += [_get_opt(self._g[n]._limits, "tr", LIMITS_DEFAULT["tr"])]
+                lii += [list(_get_opt(self._g[n]._limits, "ii", LIMITS_DEFAULT["ii"]))]
+                lio += [list(_get_opt(self._g[n]._limits, "io", LIMITS_DEFAULT["io"]))]
+                lvi += [list(_get_opt(self._g[n]._limits, "vi", LIMITS_DEFAULT["vi"]))]
+                lvo += [list(_get_opt(self._g[n]._limits, "vo", LIMITS_DEFAULT["vo"]))]
+                lpi += [list(_get_opt(self._g[n]._limits, "pi", LIMITS_DEFAULT["pi"]))]
+                lpo += [list(_get_opt(self._g[n]._limits, "po", LIMITS_DEFAULT["po"]))]
+                lpl += [list(_get_opt(self._g[n]._limits, "pl", LIMITS_DEFAULT["pl"]))]
+                lrt += [list(_get_opt(self._g[n]._limits, "tr", LIMITS_DEFAULT["tr"]))]
         # report
         res = {}
         res["Component"] = names
@@ -1088,6 +1204,7 @@ class System:
             raise ValueError("Loss components does not support load phases!")
 
         self._g.attrs["phase_conf"][name] = phase_conf
+        self._solvers = {}
 
     def phases(self) -> pd.DataFrame:
         """Return load phases and parameters for all system components.
@@ -1127,9 +1244,9 @@ class System:
                 if ph_names == []:
                     ph_names += ["N/A"]
             elif tname == "LOAD":
-                if len(list(self._phase_lkup[n].keys())) > 0:
+                if len(self._phase_lkup[n]) > 0:
                     for p in phase_names:
-                        if p in list(self._phase_lkup[n].keys()):
+                        if p in self._phase_lkup[n]:
                             ph_names += [p]
                 if ph_names == []:
                     ph_names += ["N/A"]
@@ -1240,10 +1357,10 @@ class System:
         self,
         name: str,
         *,
-        cmap: matplotlib.colors.Colormap = "viridis",
+        cmap: "matplotlib.colors.Colormap" = "viridis",
         inpdata: bool = True,
         plot3d: bool = False,
-    ) -> matplotlib.figure.Figure | None:
+    ) -> "matplotlib.figure.Figure | None":
         """Plot 1D or 2D interpolation data.
 
         If a component has a parameter defined as either 1D or 2D interpolation data,
@@ -1281,6 +1398,9 @@ class System:
         """
         if not name in self._g.attrs["nodes"].keys():
             raise ValueError("Component name is not valid!")
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import LinearLocator
+
         n = self._g.attrs["nodes"][name]
         if isinstance(self._g[n]._ipr, _Interp1d):
             annot = self._g[n]._get_annot()
@@ -1288,7 +1408,7 @@ class System:
             xmin = max(self._g[n]._ipr._x[0] - 0.15 * max(self._g[n]._ipr._x), 0.0)
             xmax = 1.15 * max(self._g[n]._ipr._x)
             x = np.linspace(xmin, xmax, num=200)
-            fx = np.interp(x, self._g[n]._ipr._x, self._g[n]._ipr._fx)
+            fx = self._g[n]._ipr._interp_vec(x, x)
             plt.plot(x, fx, "-")
             if inpdata:
                 plt.plot(
@@ -1310,14 +1430,7 @@ class System:
             ymax = 1.15 * max(self._g[n]._ipr._y)
             Y = np.linspace(ymin, ymax, num=100)
             X, Y = np.meshgrid(X, Y)
-            interp = LinearNDInterpolator(
-                list(zip(self._g[n]._ipr._x, self._g[n]._ipr._y)), self._g[n]._ipr._fxy
-            )
-            Z = interp(X, Y)
-            for i in range(len(X)):
-                for j in range(len(Y)):
-                    if np.isnan(Z[i, j]):
-                        Z[i, j] = self._g[n]._ipr._interp(X[i, j], Y[i, j])
+            Z = self._g[n]._ipr._interp_vec(X, Y)
             if not plot3d:
                 fig = plt.figure()
                 plt.pcolormesh(X, Y, Z, shading="auto", cmap=cmap)
@@ -1366,7 +1479,7 @@ class System:
         cutoff: float,
         pfunc: Callable[[], tuple[float, float, float]],
         dfunc: Callable[[float, float], tuple[float, float, float]],
-        tags: dict = {},
+        tags: dict = None,
     ) -> pd.DataFrame:
         """Estimate battery life.
 
@@ -1442,6 +1555,10 @@ class System:
             while state[0] > 0.0 and state[1] > cutoff:
                 self._g[pidx]._params["vo"] = state[1]
                 self._g[pidx]._params["rs"] = state[2]
+                self._g[pidx]._vo = state[1]
+                self._g[pidx]._rs = state[2]
+                for bs in self._solvers.values():
+                    bs._update(pidx)
                 _, i, _ = self._solve(phase=phase_list[phidx])
                 if phase_list == [""]:
                     deltat = (cap[0] / i[pidx]) * 3.6
@@ -1462,13 +1579,17 @@ class System:
         # restore source params
         self._g[pidx]._params["vo"] = vo_org
         self._g[pidx]._params["rs"] = rs_org
+        self._g[pidx]._vo = vo_org
+        self._g[pidx]._rs = rs_org
+        for bs in self._solvers.values():
+            bs._update(pidx)
         # result
         res = {}
         res["Time (s)"] = t
         res["Capacity (Ah)"] = cap
         res["Voltage (V)"] = volt
         res["Resistance (Ohm)"] = rs
-        if tags != {}:
+        if tags:
             for key in tags.keys():
                 res[key] = [tags[key]] * len(t)
         return pd.DataFrame(res)
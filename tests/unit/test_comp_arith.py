@@ -460,3 +460,46 @@ def test_linreg(linreg, name, vo, vdrop, iq, iis, rt, active_phases):
             eeff = 100.0 * abs(opwr / ipwr)
         assert close(eff, eeff), "Check LinReg efficiency"
         assert close(tr, eloss * rt), "Check LinReg temperature rise"
+
+
+def test_sweep():
+    """Evaluate components at arrays of operating points"""
+    from sysloss.components import _sweep_inp_curr, _sweep_outp_volt, _sweep_pwr_loss
+
+    eff = {"vi": [5.0], "io": [0.1, 0.5, 0.9], "eff": [[0.55, 0.78, 0.92]]}
+    iq = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "iq": [[0.01, 0.02], [0.015, 0.03]]}
+    comps = [
+        Converter("Conv", vo=3.3, eff=eff, iq=1e-3),
+        Converter("Buck", vo=1.8, eff=0.85, iis=1e-4),
+        LinReg("LDO", vo=2.5, vdrop=0.4, iq=iq),
+        RLoss("Cable", rs=0.1),
+        PLoad("Load", pwr=2.0),
+    ]
+    vi = np.linspace(4.0, 14.0, 11)
+    io = np.linspace(0.0, 1.0, 11)
+    for c in comps:
+        ii = _sweep_inp_curr(c, vi, 3.0, io)
+        vo = _sweep_outp_volt(c, vi, ii, io)
+        pl = _sweep_pwr_loss(c, vi, vo, ii, io)
+        assert len(ii) == len(vi), "sweep length"
+        for k in range(len(vi)):
+            assert close(ii[k], c._solv_inp_curr(vi[k], 3.0, io[k], "")), c
+            assert close(vo[k], c._solv_outp_volt(vi[k], ii[k], io[k], "")), c
+            assert close(
+                [p[k] for p in pl],
+                c._solv_pwr_loss(vi[k], vo[k], ii[k], io[k], ""),
+            ), c
+    ii = _sweep_inp_curr(comps[1], 5.0, 1.8, io, "off", ["on"])
+    assert close(ii, np.full(len(io), 1e-4)), "sweep off phase"
+    vi, ii = [0.0, 0.1, -5.0], [1.0, 1.0, -1.0]
+    for c in [RLoss("Cable", rs=0.5), VLoss("Diode", vdrop=0.3)]:
+        pl = _sweep_pwr_loss(c, vi, 0.0, ii, ii)
+        for k in range(len(vi)):
+            assert close(
+                [p[k] for p in pl], c._solv_pwr_loss(vi[k], 0.0, ii[k], ii[k], "")
+            ), "sweep zero and unstable vi"
+    for c in [LinReg("LDO", vo=3.3), LinReg("LDO", vo=-3.3, vdrop=0.3)]:
+        vo = _sweep_outp_volt(c, [5.0, 0.2], 0.0, 0.1)
+        for k, v in enumerate([5.0, 0.2]):
+            vs = c._solv_outp_volt(v, 0.0, 0.1, "")
+            assert vo[k] == vs and np.signbit(vo[k]) == np.signbit(vs), c
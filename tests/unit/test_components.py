@@ -24,7 +24,8 @@
 from sysloss.components import *
 from sysloss.components import _ComponentTypes, _ComponentInterface
 from sysloss.components import LIMITS_DEFAULT
-from sysloss.components import _Interp0d, _Interp1d, _Interp2d
+from sysloss.components import _Interp0d, _Interp1d, _Interp2d, _load_toml
+from sysloss.components import _Interp1dGroup, INTERP_GROUP_MIN
 import numpy as np
 import pytest
 
@@ -210,3 +211,148 @@ def test_interpolators():
     assert close(interp2d._interp(1.7, 5), fxy[5]), "2D interpolator q5"
     assert close(interp2d._interp(1.7, 0.33), fxy[2]), "2D interpolator q6"
     assert close(interp2d._interp(0.5, 2.75), fxy[1]), "2D interpolator q7"
+
+
+def test_load_toml(tmp_path):
+    """Check cached .toml file loading"""
+    fname = tmp_path / "pload.toml"
+    fname.write_text("[pload]\npwr = 0.5\n")
+    ca = _load_toml(fname)
+    ca["pload"]["pwr"] = 1.0
+    cb = _load_toml(fname)
+    assert cb["pload"]["pwr"] == 0.5, "Cached config is not modified by caller"
+    fname.write_text("[pload]\npwr = 0.75\n")
+    cc = _load_toml(fname)
+    assert cc["pload"]["pwr"] == 0.75, "Modified file is parsed again"
+
+
+def test_pickle():
+    """Pickle components with interpolation tables"""
+    import pickle
+
+    eff = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "eff": [[0.8, 0.9], [0.7, 0.85]]}
+    iq = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "iq": [[0.01, 0.02], [0.015, 0.03]]}
+    for c in [Converter("Buck", vo=3.3, eff=eff), LinReg("LDO", vo=2.5, iq=iq)]:
+        a = c._ipr._interp(0.3, 7.0)
+        c._ipr._interp_vec(np.array([0.3]), np.array([7.0]))
+        cc = pickle.loads(pickle.dumps(c))
+        assert cc._params == c._params, "Unpickled parameters"
+        assert cc._ipr._intp is None, "Unpickled array interpolator"
+        assert cc._ipr._interp(0.3, 7.0) == a, "Unpickled 2D interpolation"
+
+
+def test_interp_vec():
+    """Check array interpolation against scalar interpolation"""
+    rng = np.random.default_rng(1)
+    xq = 1.2 * rng.random(50)
+    yq = 15.0 * rng.random(50)
+    interp0d = _Interp0d(0.85)
+    assert np.allclose(interp0d._interp_vec(xq, yq), 0.85), "0D array interpolation"
+    interp1d = _Interp1d([0.1, 0.5, 0.9], [0.5, 0.6, 0.7])
+    assert np.allclose(
+        interp1d._interp_vec(xq, yq), [interp1d._interp(a, b) for a, b in zip(xq, yq)]
+    ), "1D array interpolation"
+    x = [0.1, 0.5, 0.9, 0.1, 0.5, 0.9]
+    y = [3.3, 3.3, 3.3, 12.0, 12.0, 12.0]
+    interp2d = _Interp2d(x, y, [0.5, 0.6, 0.7, 0.55, 0.65, 0.75])
+    assert np.allclose(
+        interp2d._interp_vec(xq, yq), [interp2d._interp(a, b) for a, b in zip(xq, yq)]
+    ), "2D array interpolation"
+
+
+def test_limits_default():
+    """Check that default limits are not shared between components"""
+    with pytest.raises(TypeError):
+        LIMITS_DEFAULT["vi"] = [0.0, 5.0]
+    la = PLoad("Load 1", pwr=0.1)
+    lb = PLoad("Load 2", pwr=0.1)
+    la._limits["vi"][1] = 5.0
+    assert lb._limits["vi"] == [0.0, 1.0e6], "Default limits copied"
+    assert LIMITS_DEFAULT["vi"] == (0.0, 1.0e6), "Default limits unchanged"
+
+
+def test_interp2d_grid():
+    """Check 2D interpolator created from grid data"""
+    io = [0.1, 0.5, 0.9]
+    vi = [3.3, 12.0]
+    fxy = [[0.5, 0.6, 0.7], [0.55, 0.65, 0.75]]
+    interp2d = _Interp2d._from_grid(io, vi, fxy)
+    for j in range(len(vi)):
+        for i in range(len(io)):
+            assert close(interp2d._interp(io[i], vi[j]), fxy[j][i]), "2D grid data"
+
+
+def test_slots():
+    """Check that components have no instance dict"""
+    comps = [
+        Source("Source", vo=5.0),
+        PLoad("PLoad", pwr=0.1),
+        ILoad("ILoad", ii=0.1),
+        RLoad("RLoad", rs=10.0),
+        RLoss("RLoss", rs=0.1),
+        VLoss("VLoss", vdrop=0.1),
+        Converter("Converter", vo=3.3, eff=0.9),
+        LinReg("LinReg", vo=3.3),
+    ]
+    for c in comps:
+        assert not hasattr(c, "__dict__"), c._params["name"]
+        with pytest.raises(AttributeError):
+            c._typo = 0.0
+
+
+def test_interp1d_group():
+    """Check grouped 1D interpolation against scalar interpolation"""
+    rng = np.random.default_rng(2)
+    iprs = []
+    for k in range(INTERP_GROUP_MIN):
+        x = np.unique(rng.random(1 + k % 6)) + k
+        iprs += [_Interp1d(x, rng.random(len(x)))]
+    group = _Interp1dGroup(iprs)
+    xq = [[ipr._xl[0] for ipr in iprs], [ipr._xl[-1] for ipr in iprs]]
+    xq += [np.arange(len(iprs)) + 2.0 * rng.random(len(iprs)) - 0.5 for _ in range(5)]
+    for x in xq:
+        assert np.allclose(
+            group._interp_vec(np.array(x), None),
+            [ipr._interp(xk, 0.0) for ipr, xk in zip(iprs, x)],
+        ), "Grouped 1D interpolation"
+
+
+def test_shared_interp():
+    """Components with identical tables share one interpolator"""
+    from sysloss.components import _vec_ipr, _vec_interp
+
+    iq = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "iq": [[0.01, 0.02], [0.015, 0.03]]}
+    eff = {"vi": [5.0], "io": [0.1, 0.5, 0.9], "eff": [[0.55, 0.78, 0.92]]}
+    for cls, prm in [(LinReg, {"iq": iq}), (Converter, {"eff": eff})]:
+        comps = [cls(str(k), vo=3.3, **prm) for k in range(INTERP_GROUP_MIN)]
+        assert all(c._ipr is comps[0]._ipr for c in comps), "Shared interpolator"
+        ipr = _vec_ipr(comps)
+        assert ipr is comps[0]._ipr, "Shared interpolator in batch"
+        io = np.linspace(0.0, 1.0, len(comps))
+        vi = np.linspace(4.0, 14.0, len(comps))
+        assert np.allclose(
+            _vec_interp(ipr, io, vi),
+            [c._ipr._interp(x, y) for c, x, y in zip(comps, io, vi)],
+        ), "Shared interpolation"
+    iq2 = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "iq": [[0.01, 0.02], [0.015, 0.04]]}
+    assert (
+        LinReg("A", vo=3.3, iq=iq)._ipr is not LinReg("B", vo=3.3, iq=iq2)._ipr
+    ), "Different tables"
+
+
+def test_interp_release():
+    """Shared interpolators are released with the last component using them"""
+    import weakref
+    from sysloss.components import _INTERP_CACHE
+
+    n = len(_INTERP_CACHE)
+    iq = {"vi": [5.0, 12.0], "io": [0.1, 0.5], "iq": [[0.01, 0.02], [0.015, 0.05]]}
+    eff = {"vi": [5.0], "io": [0.1, 0.5, 0.9], "eff": [[0.55, 0.78, 0.93]]}
+    comps = [LinReg("LDO", vo=3.3, iq=iq), Converter("Buck", vo=1.8, eff=eff)]
+    comps[0]._ipr._interp(0.3, 7.0)
+    comps[0]._ipr._interp_vec(np.array([0.3]), np.array([7.0]))
+    refs = [weakref.ref(c._ipr) for c in comps]
+    assert len(_INTERP_CACHE) == n + 2, "Interpolators in cache"
+    del comps
+    assert all(r() is None for r in refs), "Interpolators released"
+    assert len(_INTERP_CACHE) == n, "Interpolators removed from cache"
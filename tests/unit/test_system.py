@@ -25,11 +25,12 @@ import numpy as np
 import rich
 
 import matplotlib
+import sysloss.system
 from sysloss.system import System
 from sysloss.components import *
 
 
-def test_case1():
+def test_case1(tmp_path):
     """Check system consisting of all component types"""
     case1 = System("Case1 system", Source("3V coin", vo=3, rs=13e-3))
     case1.add_comp("3V coin", comp=Converter("1.8V buck", vo=1.8, eff=0.87, iq=12e-6))
@@ -58,7 +59,7 @@ def test_case1():
     assert (
         df[df["Component"] == "System total"]["Warnings"][rows - 1] == ""
     ), "Case 1 warnings"
-    case1.save("tests/unit/case1.json")
+    case1.save(tmp_path / "case1.json")
     dfp = case1.params(limits=True)
     assert len(dfp) == rows - 1, "Case1 parameters row count"
     assert case1.tree() == None, "Case1 tree output"
@@ -75,7 +76,7 @@ def test_case1():
     ), "Case parameters interpolator"
 
     # reload system from json
-    case1b = System.from_file("tests/unit/case1.json")
+    case1b = System.from_file(tmp_path / "case1.json")
     df2 = case1b.solve()
     assert len(df2) == rows, "Case1b solution row count"
 
@@ -248,7 +249,7 @@ def test_case12():
     ), "Case 12 warnings"
 
 
-def test_case13():
+def test_case13(tmp_path):
     """Multi-source"""
     case13 = System("Case13 system", Source("3.3V", vo=3.3))
     case13.add_source(Source("12V", vo=12, limits={"io": [0, 1e-3]}))
@@ -266,7 +267,7 @@ def test_case13():
     assert (
         df[df["Component"] == "Subsystem 12V"]["Warnings"][6] == "Yes"
     ), "Case 13 Subsystem 12V warnings"
-    case13.save("tests/unit/case13.json")
+    case13.save(tmp_path / "case13.json")
     with pytest.raises(ValueError):
         case13.del_comp("12V", del_childs=False)
     case13.del_comp("12V")
@@ -278,7 +279,7 @@ def test_case13():
     with pytest.raises(ValueError):
         case13.del_comp("3.3V")
     # reload case13 from file
-    case13b = System.from_file("tests/unit/case13.json")
+    case13b = System.from_file(tmp_path / "case13.json")
     dff = case13b.solve()
     assert len(dff) == 9, "Case13 solution row count"
     assert (
@@ -460,3 +461,87 @@ def test_case17():
     )
     assert bdf.shape[0] < 1000, "Case17 result rows with load phases"
     assert bdf.shape[1] == 5, "Case17 result columns with load phases"
+
+
+def test_case18(monkeypatch):
+    """Batched solver with deleted components and unstable system"""
+    monkeypatch.setattr(sysloss.system, "BATCH_MIN_NODES", 0)
+    case18 = System("Case18 system", Source("5V", vo=5.0))
+    case18.add_comp("5V", comp=RLoss("Cable", rs=0.5))
+    case18.add_comp("Cable", comp=LinReg("LDO", vo=3.3, vdrop=0.3))
+    case18.add_comp("LDO", comp=ILoad("Load", ii=0.1))
+    case18.add_comp("Cable", comp=PLoad("Spare", pwr=0.1))
+    case18.del_comp("Spare")
+    df = case18.solve()
+    assert df[df["Component"] == "Cable"]["Vout (V)"][1] == pytest.approx(
+        4.95, rel=1e-6
+    ), "Case18 cable output voltage"
+    case18.add_comp("Cable", comp=ILoad("Overload", ii=10.0))
+    with pytest.raises(ValueError, match="RLoss component 'Cable'"):
+        case18.solve()
+
+
+def test_case19(monkeypatch):
+    """Batched limit warnings"""
+    monkeypatch.setattr(sysloss.system, "BATCH_MIN_NODES", 0)
+    lim = {"vi": [0.0, 4.0], "ii": [0.0, 0.05], "io": [0.0, 0.05], "pl": [0.0, 0.01]}
+    case19 = System("Case19 system", Source("5V", vo=5.0, rs=0.1, limits=lim))
+    case19.add_comp("5V", comp=RLoss("Cable", rs=0.2, rt=10.0, limits=lim))
+    case19.add_comp("Cable", comp=Converter("Buck", vo=3.3, eff=0.9, limits=lim))
+    case19.add_comp("Buck", comp=LinReg("LDO", vo=2.5, iq=1e-3, limits=lim))
+    case19.add_comp("LDO", comp=PLoad("MCU", pwr=0.1, limits=lim))
+    case19.add_comp("LDO", comp=ILoad("Sensor", ii=0.06, limits=lim))
+    case19.add_comp("Buck", comp=VLoss("Diode", vdrop=0.3, limits=lim))
+    case19.add_comp("Diode", comp=RLoad("Heater", rs=30.0, rt=5.0, limits=lim))
+    case19.set_sys_phases({"sleep": 100, "active": 10})
+    case19.set_comp_phases("LDO", phase_conf=["active"])
+    case19.set_comp_phases("Heater", phase_conf={"active": 30.0})
+    df = case19.solve()
+    assert any(df["Warnings"] != ""), "Case19 warnings"
+    for ph in ["sleep", "active"]:
+        assert case19._get_solver(ph)._phase == ph, "Case19 solver of phase"
+    for _, row in df[df["Type"] != ""].iterrows():
+        n = case19._get_index(row["Component"])
+        ploss = [row["Power (W)"], row["Loss (W)"], row["Efficiency (%)"]]
+        ploss += [row["Temp. rise (°C)"]]
+        w = case19._g[n]._solv_get_warns(
+            row["Vin (V)"],
+            row["Vout (V)"],
+            row["Iin (A)"],
+            row["Iout (A)"],
+            row["Phase"],
+            case19._phase_lkup[n],
+            ploss,
+        )
+        assert row["Warnings"] == w, "Case19 warnings of {}".format(n)
+
+
+def test_case20(monkeypatch):
+    """Scalar and batched solvers"""
+    case20 = System.from_file("tests/data/System v1.0.0.json")
+    df = case20.solve()
+    assert isinstance(case20._get_solver(), sysloss.system._ScalarSolver)
+    bcap = [0.0]
+
+    def bprobe():
+        bcap[0] = 0.15
+        return (bcap[0], 3.6, 0.1)
+
+    def bdeplete(time, curr):
+        bcap[0] = max(bcap[0] - time * curr / 3600.0, 0.0)
+        return (bcap[0], 3.6 - 2.0 * (0.15 - bcap[0]), 0.1 + (0.15 - bcap[0]))
+
+    case20b = System("Case20 battery", Source("LiPo", vo=3.6))
+    case20b.add_comp("LiPo", comp=Converter("Buck 1.8V", vo=1.8, eff=0.91))
+    case20b.add_comp("Buck 1.8V", comp=PLoad("MCU", pwr=0.125))
+    bdf = case20b.batt_life("LiPo", cutoff=3.4, pfunc=bprobe, dfunc=bdeplete)
+    monkeypatch.setattr(sysloss.system, "BATCH_MIN_NODES", 0)
+    bdf2 = case20b.batt_life("LiPo", cutoff=3.4, pfunc=bprobe, dfunc=bdeplete)
+    assert isinstance(case20b._get_solver(), sysloss.system._BatchedSolver)
+    assert case20b._g[0]._vo == 3.6, "Case20 battery voltage restored"
+    for col in bdf.columns:
+        assert list(bdf2[col]) == pytest.approx(list(bdf[col]), rel=1e-9), col
+    df2 = case20.solve()
+    assert list(df2["Warnings"]) == list(df["Warnings"]), "Case20 warnings"
+    for col in ["Vin (V)", "Vout (V)", "Iin (A)", "Iout (A)", "Power (W)"]:
+        assert list(df2[col]) == pytest.approx(list(df[col]), rel=1e-9), col